@@ -1,8 +1,41 @@
-import time
+import os
+import sys
+import json
 import random
-import numpy as np
+from array import array
+from bisect import bisect_left, bisect_right
 
-def quick_sort(arr):
+from external_sort import external_sort_array
+
+# NumPy, distributions e parallel_sort vengono importati solo dalle funzioni che li usano:
+# gli algoritmi in Python puro si importano senza dipendenze pesanti
+
+# Oltre questo rapporto (intervallo / n) counting_sort_np passa a np.unique
+COUNTING_RANGE_FACTOR = 16
+# Sotto questa dimensione intro_sort usa insertion sort
+INSERTION_THRESHOLD = 16
+# Lunghezza minima dei run di natural_merge_sort e soglia per il galloping
+MIN_RUN = 32
+MIN_GALLOP = 7
+
+# Soglie di default di adaptive_sort, ricalcolabili con calibration.py
+# (dai CSV degli esperimenti o misurando i motori su questa macchina)
+ADAPTIVE_DEFAULTS = {
+    "sample_size": 256,
+    "small_n": 64,
+    "presorted_fraction": 0.95,
+    "presorted_engine": "Natural Merge Sort",
+    "counting_ratio": 8.0,
+    "radix_min_n": 2000,
+    "duplicate_ratio": 0.5,
+    "default_engine": "Intro Sort"
+}
+ADAPTIVE_THRESHOLDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "adaptive_thresholds.json")
+_adaptive_thresholds = None
+
+def quick_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_by_key(quick_sort, arr, key, reverse)
     if len(arr) <= 1:
         return arr
     pivot = arr[len(arr) // 2]
@@ -11,7 +44,9 @@ def quick_sort(arr):
     right = [x for x in arr if x > pivot]
     return quick_sort(left) + middle + quick_sort(right)
 
-def quick_sort_3way(arr):
+def quick_sort_3way(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_by_key(quick_sort_3way, arr, key, reverse)
     if len(arr) <= 1:
         return arr
     pivot = arr[random.randint(0, len(arr) - 1)]
@@ -25,7 +60,111 @@ def quick_sort_3way(arr):
             gt.append(x)
     return quick_sort_3way(lt) + eq + quick_sort_3way(gt)
 
-def counting_sort(arr, max_val):
+def intro_sort(arr, key=None, reverse=False):
+    """
+    Introsort in-place e iterativo (nessuna ricorsione, nessuna lista temporanea).
+    Usa uno stack esplicito di intervalli, partizione a tre vie (bandiera olandese)
+    con pivot mediana di tre casuali, insertion sort sui tratti piccoli e heapsort
+    quando la profondità supera 2*log2(n). Ordina arr e lo restituisce.
+    Con key/reverse ordina le coppie decorate di sort_by_key (risultato stabile).
+    """
+    if key is not None or reverse:
+        arr[:] = sort_by_key(intro_sort, arr, key, reverse)
+        return arr
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    stack = [(0, n - 1, 2 * n.bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo + 1 > INSERTION_THRESHOLD:
+            if depth == 0:
+                _heap_sort_range(arr, lo, hi)
+                break
+            depth -= 1
+            lt, gt = _partition3(arr, lo, hi, _median_of_three(arr, lo, hi))
+            # Prima il lato più corto: lo stack resta O(log n)
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi, depth))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1, depth))
+                lo = gt + 1
+        else:
+            _insertion_sort_range(arr, lo, hi)
+    return arr
+
+def _median_of_three(arr, lo, hi):
+    """Restituisce la mediana di tre elementi scelti a caso in arr[lo..hi]."""
+    a = arr[random.randint(lo, hi)]
+    b = arr[random.randint(lo, hi)]
+    c = arr[random.randint(lo, hi)]
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+def _partition3(arr, lo, hi, pivot):
+    """
+    Partizione a tre vie di arr[lo..hi] attorno a pivot.
+    Restituisce (lt, gt): arr[lo..lt-1] < pivot, arr[lt..gt] == pivot, arr[gt+1..hi] > pivot.
+    """
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        x = arr[i]
+        if x < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            arr[i] = arr[gt]
+            arr[gt] = x
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def _insertion_sort_range(arr, lo, hi):
+    """Insertion sort in-place di arr[lo..hi]."""
+    for i in range(lo + 1, hi + 1):
+        x = arr[i]
+        j = i - 1
+        while j >= lo and x < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+
+def _heap_sort_range(arr, lo, hi):
+    """Heapsort in-place di arr[lo..hi] (fallback di intro_sort)."""
+    size = hi - lo + 1
+    for start in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, lo, start, size)
+    for end in range(size - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+def _sift_down(arr, lo, root, size):
+    """Fa scendere arr[lo+root] nel max-heap arr[lo..lo+size-1]."""
+    x = arr[lo + root]
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not x < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = x
+
+def counting_sort(arr, max_val, key=None, reverse=False):
+    if key is not None or reverse:
+        return counting_sort_by_key(arr, key, reverse)
     if not arr:
         return []
     
@@ -42,7 +181,71 @@ def counting_sort(arr, max_val):
 
     return sorted_arr
 
-def merge_sort(arr):
+def counting_sort_np(arr, max_val=None):
+    """
+    Counting sort vettorizzato con NumPy.
+    Lavora sull'intervallo effettivamente osservato [min, max] dell'input,
+    quindi l'argomento max_val viene ignorato (resta per compatibilità).
+    Se l'intervallo è molto più grande di n si usa np.unique, che scala con n.
+    Come counting_sort, accetta solo interi: un input non intero solleva TypeError.
+    Restituisce un ndarray se l'input è un buffer tipizzato, altrimenti una lista.
+    """
+    import numpy as np
+    a = np.asarray(arr)
+    if a.size == 0:
+        return a.copy() if _is_buffer(arr) else []
+    _require_integers(a, "counting_sort_np")
+
+    min_val = int(a.min())
+    range_size = int(a.max()) - min_val + 1
+    if range_size <= COUNTING_RANGE_FACTOR * a.size:
+        count = np.bincount((a - min_val).astype(np.intp, copy=False), minlength=range_size)
+        values = np.arange(min_val, min_val + range_size, dtype=a.dtype)
+    else:
+        values, count = np.unique(a, return_counts=True)
+    sorted_arr = np.repeat(values, count)
+
+    return sorted_arr if _is_buffer(arr) else sorted_arr.tolist()
+
+def radix_sort(arr, digit_bits=8):
+    """
+    Radix sort LSD su interi con NumPy, a cifre di digit_bits bit (8 o 11).
+    I valori vengono portati a chiavi senza segno (bit di segno invertito per i
+    tipi con segno, poi sottrazione del minimo), così i negativi sono gestiti e
+    servono solo le cifre necessarie all'intervallo effettivo. Ogni passata è un
+    ordinamento stabile per cifra: np.argsort(kind="stable") su uint8/uint16 è a
+    sua volta un counting sort, quindi il costo è O(n * passate).
+    Un input non intero (es. float) solleva TypeError.
+    Restituisce un ndarray se l'input è un buffer tipizzato, altrimenti una lista.
+    """
+    import numpy as np
+    a = np.asarray(arr)
+    if a.size == 0:
+        return a.copy() if _is_buffer(arr) else []
+    _require_integers(a, "radix_sort")
+    if a.size == 1:
+        return a.copy() if _is_buffer(arr) else list(arr)
+
+    # per i tipi senza segno (anche uint64 >= 2**63) l'ordine delle chiavi è già quello dei valori
+    sign = np.uint64(0 if np.issubdtype(a.dtype, np.unsignedinteger) else 1 << 63)
+    keys = a.astype(np.uint64) ^ sign
+    min_key = keys.min()
+    keys -= min_key
+
+    digit_dtype = np.uint8 if digit_bits <= 8 else np.uint16
+    mask = np.uint64((1 << digit_bits) - 1)
+    n_bits = int(keys.max()).bit_length()
+    for shift in range(0, n_bits, digit_bits):
+        digits = ((keys >> np.uint64(shift)) & mask).astype(digit_dtype)
+        keys = keys[np.argsort(digits, kind="stable")]
+
+    keys += min_key
+    sorted_arr = (keys ^ sign).astype(a.dtype)
+    return sorted_arr if _is_buffer(arr) else sorted_arr.tolist()
+
+def merge_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_by_key(merge_sort, arr, key, reverse)
     if len(arr) <= 1:
         return arr
     mid = len(arr) // 2
@@ -54,39 +257,382 @@ def merge(left, right):
     sorted_arr = []
     i = j = 0
     while i < len(left) and j < len(right):
-        if left[i] < right[j]:
-            sorted_arr.append(left[i])
-            i += 1
-        else:
+        # a parità prima l'elemento di sinistra: la fusione è stabile
+        if right[j] < left[i]:
             sorted_arr.append(right[j])
             j += 1
+        else:
+            sorted_arr.append(left[i])
+            i += 1
     sorted_arr.extend(left[i:])
     sorted_arr.extend(right[j:])
     return sorted_arr
 
-def clock_resolution():
-    """Stima la risoluzione del clock usando time.perf_counter()."""
-    start = time.perf_counter()
-    while time.perf_counter() == start:
-        pass
-    stop = time.perf_counter()
-    return stop - start
+def natural_merge_sort(arr):
+    """
+    Merge sort naturale bottom-up.
+    Individua i run già ordinati (quelli decrescenti vengono invertiti in-place),
+    allunga quelli troppo corti fino a MIN_RUN con insertion sort binario e li
+    fonde a coppie alternando tra arr e un unico buffer ausiliario di n posizioni
+    (dello stesso tipo di arr, che può essere anche un memoryview o un array).
+    Su un input già ordinato costa O(n). Ordina arr e lo restituisce.
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    bounds = _find_runs(arr)
+    if len(bounds) == 2:
+        return arr
+
+    src, dst = arr, _aux_buffer(arr)
+    while len(bounds) > 2:
+        merged = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo = bounds[r]
+            if r + 2 < len(bounds):
+                mid, hi = bounds[r + 1], bounds[r + 2]
+                _merge_runs(src, dst, lo, mid, hi)
+            else:
+                hi = bounds[r + 1]
+                dst[lo:hi] = src[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+def _aux_buffer(arr):
+    """Buffer ausiliario di len(arr) posizioni, dello stesso tipo di arr."""
+    if isinstance(arr, memoryview):
+        return memoryview(bytearray(arr.nbytes)).cast(arr.format)
+    if isinstance(arr, array):
+        return array(arr.typecode, bytes(len(arr) * arr.itemsize))
+    if _is_ndarray(arr):
+        import numpy as np
+        return np.empty_like(arr)
+    if type(arr) is not list:  # sottoclassi di list (es. TrackedList di instrumentation.py)
+        return type(arr)([None] * len(arr))
+    return [None] * len(arr)
+
+def _find_runs(arr):
+    """
+    Scompone arr in run ascendenti e restituisce i loro estremi [0, e1, e2, ..., n].
+    I run strettamente decrescenti vengono invertiti (restano stabili),
+    quelli più corti di MIN_RUN vengono estesi con insertion sort binario.
+    """
+    n = len(arr)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            if arr[hi] < arr[lo]:
+                while hi + 1 < n and arr[hi + 1] < arr[hi]:
+                    hi += 1
+                _reverse_range(arr, lo, hi)
+            else:
+                while hi + 1 < n and not arr[hi + 1] < arr[hi]:
+                    hi += 1
+            hi += 1
+        end = min(lo + MIN_RUN, n)
+        if hi < end:
+            _binary_insertion_range(arr, lo, hi, end)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+    return bounds
+
+def _reverse_range(arr, lo, hi):
+    """Inverte in-place arr[lo..hi]."""
+    while lo < hi:
+        arr[lo], arr[hi] = arr[hi], arr[lo]
+        lo += 1
+        hi -= 1
+
+def _binary_insertion_range(arr, lo, start, end):
+    """Estende il tratto ordinato arr[lo:start] fino a end con insertion sort binario."""
+    for i in range(start, end):
+        x = arr[i]
+        pos = bisect_right(arr, x, lo, i)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = x
+
+def _merge_runs(src, dst, lo, mid, hi):
+    """
+    Fonde i run src[lo:mid] e src[mid:hi] in dst[lo:hi] (stabile).
+    Dopo MIN_GALLOP vittorie consecutive dello stesso run copia in blocco,
+    cercando con bisect il punto in cui l'altro run torna in gioco.
+    """
+    # Prefisso del run sinistro già al suo posto
+    i = bisect_right(src, src[mid], lo, mid)
+    dst[lo:i] = src[lo:i]
+    if i == mid:
+        dst[mid:hi] = src[mid:hi]
+        return
+
+    j, k = mid, i
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            k += 1
+            j += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP and j < hi:
+                e = bisect_left(src, src[i], j, hi)
+                dst[k:k + e - j] = src[j:e]
+                k += e - j
+                j = e
+                right_wins = 0
+        else:
+            dst[k] = src[i]
+            k += 1
+            i += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and i < mid:
+                e = bisect_right(src, src[j], i, mid)
+                dst[k:k + e - i] = src[i:e]
+                k += e - i
+                i = e
+                left_wins = 0
+    dst[k:k + mid - i] = src[i:mid]
+    k += mid - i
+    dst[k:hi] = src[j:hi]
+
+# -------------------------------
+# ORDINAMENTO PER CHIAVE E PER RECORD
+# -------------------------------
+
+def sort_by_key(sort_func, arr, key=None, reverse=False):
+    """
+    Ordina arr per key(x) con sort_func (un ordinamento di interi nudi usato così
+    com'è) decorando una sola volta: ogni elemento diventa la coppia (chiave, ±indice),
+    quindi la chiave è calcolata una volta per elemento e i confronti tra chiavi
+    uguali si risolvono con l'indice. Il risultato è stabile anche con gli
+    algoritmi non stabili; con reverse=True si ordina per (chiave, -indice) e si
+    inverte, così a parità di chiave resta l'ordine originale.
+    Restituisce una nuova lista.
+    """
+    sign = -1 if reverse else 1
+    keys = arr if key is None else map(key, arr)
+    decorated = [(k, sign * i) for i, k in enumerate(keys)]
+    decorated = sort_func(decorated)
+    if reverse:
+        decorated.reverse()
+    return [arr[sign * i] for _, i in decorated]
+
+def counting_sort_by_key(arr, key=None, reverse=False):
+    """
+    Counting sort stabile per chiavi intere: le chiavi sono calcolate una volta in
+    un array parallelo, le somme prefisse danno la posizione iniziale di ogni chiave
+    e gli elementi vengono collocati nell'ordine originale. O(n + intervallo delle chiavi).
+    """
+    if not arr:
+        return []
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    min_key = min(keys)
+    count = [0] * (max(keys) - min_key + 1)
+    for k in keys:
+        count[k - min_key] += 1
+    if reverse:
+        count.reverse()
+    position = 0
+    for i, freq in enumerate(count):
+        count[i] = position
+        position += freq
+    if reverse:
+        count.reverse()
+
+    sorted_arr = [None] * len(keys)
+    for x, k in zip(arr, keys):
+        sorted_arr[count[k - min_key]] = x
+        count[k - min_key] += 1
+    return sorted_arr
+
+def sort_permutation(columns, reverse=False):
+    """
+    Ordinamento struct-of-arrays: columns è una sequenza di colonne della stessa
+    lunghezza (la prima è la chiave principale, le altre spareggiano). Restituisce
+    la permutazione stabile degli indici che ordina i record, senza spostarli:
+    i record si leggono poi come col[perm]. Se tutte le colonne sono ndarray si usa
+    np.lexsort, altrimenti merge_sort sulle chiavi composte (tuple) decorate una volta.
+    """
+    n = len(columns[0]) if columns else 0
+    if columns and all(_is_ndarray(col) for col in columns):
+        import numpy as np
+        if not reverse:
+            return np.lexsort(columns[::-1])
+        # (chiavi crescenti, indice decrescente) invertito: chiavi decrescenti, indice crescente
+        return np.lexsort((-np.arange(n),) + tuple(columns[::-1]))[::-1]
+    return sort_by_key(merge_sort, range(n), key=lambda i: tuple(col[i] for col in columns), reverse=reverse)
+
+# Algoritmi tra cui sceglie adaptive_sort (le soglie li indicano per nome)
+ADAPTIVE_ENGINES = {
+    "Intro Sort": intro_sort,
+    "Natural Merge Sort": natural_merge_sort,
+    "Counting Sort NumPy": counting_sort_np,
+    "Radix Sort": radix_sort
+}
+
+def sample_profile(arr, sample_size=256):
+    """
+    Stima a basso costo le caratteristiche dell'input da un campione casuale:
+    intervallo dei valori, quota di duplicati, quota di coppie adiacenti
+    in ordine crescente/decrescente e se gli elementi sono interi.
+    """
+    n = len(arr)
+    idx = random.sample(range(n - 1), min(sample_size, n - 1))
+    values = [arr[i] for i in idx]
+    if _is_buffer(arr):
+        integer = memoryview(arr).format.lstrip("@=<>!") in "bBhHiIlLqQnN"
+    else:
+        integer = all(isinstance(v, int) for v in values)
+    return {
+        "range": int(max(values)) - int(min(values)) + 1 if integer else None,
+        "duplicates": 1 - len(set(values)) / len(values),
+        "ascending": sum(1 for i in idx if not arr[i + 1] < arr[i]) / len(idx),
+        "descending": sum(1 for i in idx if not arr[i] < arr[i + 1]) / len(idx),
+        "integer": integer
+    }
+
+def adaptive_thresholds():
+    """
+    Restituisce le soglie usate da adaptive_sort: i default aggiornati con
+    il file di calibrazione (vedi calibration.py), letto una sola volta.
+    """
+    global _adaptive_thresholds
+    if _adaptive_thresholds is None:
+        thresholds = dict(ADAPTIVE_DEFAULTS)
+        if os.path.exists(ADAPTIVE_THRESHOLDS_FILE):
+            with open(ADAPTIVE_THRESHOLDS_FILE) as f:
+                thresholds.update(json.load(f))
+        _adaptive_thresholds = thresholds
+    return _adaptive_thresholds
 
-R = clock_resolution()
-T_min = R * 10
-subtract_init = True
+def set_adaptive_thresholds(thresholds):
+    """Sostituisce le soglie correnti (i valori mancanti restano ai default)."""
+    global _adaptive_thresholds
+    _adaptive_thresholds = {**ADAPTIVE_DEFAULTS, **thresholds}
+
+def adaptive_sort(arr):
+    """
+    Sceglie l'algoritmo più adatto all'input e lo esegue.
+    Input quasi ordinati -> merge sort naturale; interi con intervallo piccolo
+    rispetto a n -> counting sort; interi con n grande -> radix sort (solo se
+    tutto l'input, non solo il campione, è di interi a 64 bit); molti duplicati ->
+    introsort (partizione a tre vie); altrimenti l'algoritmo di default.
+    Le soglie vengono da adaptive_thresholds().
+    Qualunque motore venga scelto, ordina arr in-place (lista, ndarray, array o
+    memoryview) e lo restituisce: il risultato dei motori che producono un nuovo
+    array (counting sort, radix sort) viene ricopiato in arr.
+    """
+    thresholds = adaptive_thresholds()
+    n = len(arr)
+    if n <= thresholds["small_n"]:
+        return _sort_in_place(intro_sort, arr)
+
+    profile = sample_profile(arr, thresholds["sample_size"])
+    if max(profile["ascending"], profile["descending"]) >= thresholds["presorted_fraction"]:
+        return _sort_in_place(ADAPTIVE_ENGINES[thresholds["presorted_engine"]], arr)
+    if profile["integer"] and _all_integers(arr):
+        limit = thresholds["counting_ratio"] * n
+        # il campione sottostima l'intervallo: prima di scegliere il counting sort lo si verifica
+        if profile["range"] <= limit and int(max(arr)) - int(min(arr)) + 1 <= limit:
+            return _sort_in_place(counting_sort_np, arr)
+        if n >= thresholds["radix_min_n"]:
+            return _sort_in_place(radix_sort, arr)
+    if profile["duplicates"] >= thresholds["duplicate_ratio"]:
+        return _sort_in_place(intro_sort, arr)
+    return _sort_in_place(ADAPTIVE_ENGINES[thresholds["default_engine"]], arr)
+
+def _all_integers(arr):
+    """
+    True se tutto arr, non solo il campione di sample_profile, è un intero rappresentabile
+    da counting_sort_np e radix_sort: un float fuori dal campione o interi oltre 64 bit
+    (ndarray di oggetti) li farebbero fallire. I buffer tipizzati hanno già un formato intero.
+    """
+    if _is_buffer(arr):
+        return True
+    import numpy as np
+    return np.asarray(arr).dtype.kind in "iu"
+
+def _sort_in_place(engine, arr):
+    """Esegue engine su arr e, se il motore restituisce un nuovo array, lo ricopia in arr."""
+    seq = as_sequence(arr)
+    result = engine(seq)
+    if result is not seq:
+        if isinstance(arr, list):
+            arr[:] = result
+        else:
+            import numpy as np
+            np.asarray(arr)[:] = result
+    return arr
 
 m_fixed = 100000
-n_values = np.logspace(np.log10(100), np.log10(100000), num=100, dtype=int)
 
-algoritmi = {
-        "Quick Sort": lambda arr: quick_sort(arr),
-        "Quick Sort 3-Way": lambda arr: quick_sort_3way(arr),
-        "Counting Sort": lambda arr: counting_sort(arr, m_fixed),
-        "Merge Sort": lambda arr: merge_sort(arr),
-        "Sorting python": lambda arr: arr.sort()
-        }
+def build_algorithms(m=m_fixed):
+    """Registro nome -> funzione degli algoritmi confrontati; il counting sort puro usa m come massimo."""
+    return {
+        "Quick Sort": lambda arr: quick_sort(as_sequence(arr)),
+        "Quick Sort 3-Way": lambda arr: quick_sort_3way(as_sequence(arr)),
+        "Intro Sort": lambda arr: intro_sort(as_sequence(arr)),
+        "Counting Sort": lambda arr: counting_sort(as_sequence(arr), m),
+        "Counting Sort NumPy": lambda arr: counting_sort_np(arr),
+        "Radix Sort": lambda arr: radix_sort(arr),
+        "Radix Sort 11-bit": lambda arr: radix_sort(arr, digit_bits=11),
+        "Merge Sort": lambda arr: merge_sort(as_sequence(arr)),
+        "Natural Merge Sort": lambda arr: natural_merge_sort(as_sequence(arr)),
+        "Parallel Merge Sort": lambda arr: _parallel_merge_sort(arr),
+        "Adaptive Sort": lambda arr: adaptive_sort(arr),
+        "External Merge Sort": lambda arr: external_sort_array(arr),
+        "Sort": lambda arr: arr.sort()
+    }
+
+algoritmi = build_algorithms(m_fixed)
+
+def _parallel_merge_sort(arr):
+    """Motore "Parallel Merge Sort" degli esperimenti: sempre il percorso parallelo, anche sotto PARALLEL_THRESHOLD."""
+    from parallel_sort import parallel_merge_sort
+    return parallel_merge_sort(arr, force=True)
 
 def generate_array(n, m):
     """Genera un array di n interi casuali compresi in [1, m]."""
-    return [random.randint(1, m) for _ in range(n)]
\ No newline at end of file
+    return [random.randint(1, m) for _ in range(n)]
+
+def generate_worst_case_array(n, m, distribution="sorted", seed=None): # caso di array ordinato
+    """
+    Genera un array 'worst-case': di default un array ordinato in modo crescente.
+    L'input ordinato non è il caso pessimo di tutti gli algoritmi: distribution
+    sceglie una delle distribuzioni di distributions.py (es. "reversed",
+    "few_unique", "median_killer" per il pivot centrale di quick_sort)
+    """
+    from distributions import generate
+    return generate(distribution, n, m, seed).tolist()
+
+def as_sequence(arr):
+    """
+    Vista senza copia su cui gli algoritmi in Python puro lavorano in-place:
+    un ndarray diventa un memoryview (l'indicizzazione restituisce int Python),
+    liste, array e memoryview restano invariati.
+    """
+    return memoryview(arr) if _is_ndarray(arr) else arr
+
+def _is_buffer(arr):
+    """True se arr è un buffer tipizzato (ndarray, memoryview o array)."""
+    return isinstance(arr, (memoryview, array)) or _is_ndarray(arr)
+
+def _require_integers(a, name):
+    """TypeError se l'ndarray a non è di interi: i motori per interi non devono troncare i float."""
+    import numpy as np
+    if not np.issubdtype(a.dtype, np.integer):
+        raise TypeError(f"{name} ordina solo interi, ricevuto dtype {a.dtype}")
+
+def _is_ndarray(arr):
+    """True se arr è un ndarray, senza importare NumPy (se non è caricato non esistono ndarray)."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(arr, np.ndarray)
\ No newline at end of file
@@ -1,13 +1,10 @@
+from string_search import prefix_function
+
 def max_sub_string(s):
+    # periodo minimo = n - bordo più lungo (funzione prefisso di string_search.py)
     n = len(s)
-    r = [0] * n
-    for i in range(1, n):
-        k = r[i-1]
-        while k > 0 and s[k] != s[i]:
-            k = r[k - 1]
-        if (s[k] == s[i]):
-            k += 1
-        r[i] = k
+    r = prefix_function(s)
+    k = r[-1] if n else 0
     p = n - k
     return p
 
@@ -18,6 +15,7 @@ def max_sub_string(s):
         for i in range(n):
             if (s[i] != s[i % p]):
                 periodo = False
+                break  # basta una posizione diversa per scartare p
         if periodo == True:
             return p
     return n
@@ -27,7 +25,8 @@ s = input()
 a = periodo(s)
 print(a)'''
 
-s = input()
+if __name__ == "__main__":
+    s = input()
 
-b = max_sub_string(s)
-print(b)
\ No newline at end of file
+    b = max_sub_string(s)
+    print(b)
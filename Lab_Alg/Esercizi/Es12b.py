@@ -5,6 +5,7 @@
         for i in range(n):
             if (s[i] != s[i % p]):
                 periodo = False
+                break  # basta una posizione diversa per scartare p
         if periodo == True:
             return p
     return n
@@ -12,4 +13,7 @@
 s = input()
 
 a = periodo(s)
-print(a)'''
\ No newline at end of file
+print(a)'''
+
+# Versione in linea (periodo aggiornato a ogni carattere aggiunto, O(1) ammortizzato):
+# string_search.PeriodTracker
@@ -1,8 +1,14 @@
+from bst_stream import validate_preorder
+
 def leggi_input(s):
     tokens = s.split()
     return ["NULL" if x == "NULL" else int(x) for x in tokens]
 
 def verifica_bst(array):
+    # Versione iterativa (stack esplicito, vedi bst_stream.py), stesso risultato di verifica_bst_ricorsiva
+    return validate_preorder(array, null="NULL")[0]
+
+def verifica_bst_ricorsiva(array):
     i = 0
     n = len(array)
     
@@ -40,8 +46,9 @@ def verifica_bst(array):
     else:
         return 0
 
-s = input()
+if __name__ == "__main__":
+    s = input()
 
-array = leggi_input(s)
+    array = leggi_input(s)
 
-print(verifica_bst(array))
\ No newline at end of file
+    print(verifica_bst(array))
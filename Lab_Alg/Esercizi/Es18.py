@@ -1,9 +1,15 @@
+from bst_stream import validate_preorder
 
 def leggi_input(s):
     tokens = s.split()
     return ["NULL" if x == "NULL" else int(x) for x in tokens]
 
 def verifica_bst(array):
+    # Versione iterativa (stack esplicito, vedi bst_stream.py): niente RecursionError
+    # sugli alberi degeneri; token in più dopo l'albero -> 0, come il controllo i == n di Es18(alt)
+    return validate_preorder(array, null="NULL")[0]
+
+def verifica_bst_ricorsiva(array):
     i = [0]
 
     def parsing(min_val, max_val):
@@ -33,13 +39,15 @@ def verifica_bst(array):
         # Punto 8, 15, 20, 21, 22: ritorno verso l'alto, controllo che entrambi i rami siano validi
         return left_valid and right_valid
 
-    return int(parsing(float('-inf'), float('inf')))
+    # Punto 23: l'albero è valido solo se ha usato tutti i token
+    return int(parsing(float('-inf'), float('inf')) and i[0] == len(array))
 
-s = input()
+if __name__ == "__main__":
+    s = input()
 
-array = leggi_input(s)
+    array = leggi_input(s)
 
-print(verifica_bst(array))
+    print(verifica_bst(array))
 
 '''
 NON BST
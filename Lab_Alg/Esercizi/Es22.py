@@ -1,8 +1,18 @@
+import gc
+import time
+import random
+from operator import itemgetter
+import tracemalloc
+from array import array
+
 class Node:
+    __slots__ = ("key", "value", "height", "size", "left", "right")  # niente __dict__ per nodo
+
     def __init__(self, key: int, value: str):
         self.key = key
         self.value = value
         self.height = 1  # Ogni nodo parte con altezza 1
+        self.size = 1  # Nodi nel sottoalbero (per rank e select)
         self.left = None
         self.right = None
 
@@ -31,8 +41,9 @@ class AVLTree:
             node.value = value  # aggiorna il valore se la chiave esiste già
             return node
 
-        # aggiorna altezza
+        # aggiorna altezza e dimensione
         node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
 
         # ribilanciamento
         return self._balance(node)
@@ -76,10 +87,11 @@ class AVLTree:
         return node
     
     def _update_height(self, node: Node):
-        """Aggiorna l'altezza del nodo corrente basandosi sui figli."""
+        """Aggiorna altezza e dimensione del nodo corrente basandosi sui figli."""
         left_height = node.left.height if node.left else 0
         right_height = node.right.height if node.right else 0
         node.height = 1 + max(left_height, right_height)
+        node.size = 1 + self._size(node.left) + self._size(node.right)
     # _______________________________________________________________________ #
 
     def find(self, key: int) -> str:
@@ -123,6 +135,12 @@ class AVLTree:
             return 0
         return node.height
 
+    def _size(self, node: Node) -> int:
+        """Restituisce il numero di nodi del sottoalbero"""
+        if node is None:
+            return 0
+        return node.size
+
     def _get_balance(self, node: Node) -> int:
         """Restituisce il fattore di bilanciamento"""
         if node is None:
@@ -138,9 +156,11 @@ class AVLTree:
         y.left = x
         x.right = T2
 
-        # aggiorna altezze
+        # aggiorna altezze e dimensioni
         x.height = 1 + max(self._height(x.left), self._height(x.right))
         y.height = 1 + max(self._height(y.left), self._height(y.right))
+        y.size = x.size
+        x.size = 1 + self._size(x.left) + self._size(x.right)
 
         return y  # y nuova radice del sottoalbero
 
@@ -153,9 +173,11 @@ class AVLTree:
         x.right = y
         y.left = T2
 
-        # aggiorna altezze
+        # aggiorna altezze e dimensioni
         y.height = 1 + max(self._height(y.left), self._height(y.right))
         x.height = 1 + max(self._height(x.left), self._height(x.right))
+        x.size = y.size
+        y.size = 1 + self._size(y.left) + self._size(y.right)
 
         return x  # x nuova radice del sottoalbero
 
@@ -181,9 +203,452 @@ class AVLTree:
 
         return node
 
-def interactive_loop():
-    """Ciclo interattivo per eseguire i comandi"""
+    # ------------------- CARICAMENTO IN BLOCCO ------------------- #
+
+    @classmethod
+    def bulk_load(cls, sorted_items):
+        """
+        Albero perfettamente bilanciato dalle coppie (chiave, valore) già ordinate per
+        chiave, in O(n) invece di O(n log n) con n insert: la mediana di ogni intervallo
+        diventa la radice del sottoalbero. A parità di chiave vale l'ultimo valore.
+        """
+        tree = cls()
+        keys, values = _dedup_sorted(sorted_items)
+        tree.root = _build_balanced(keys, values)
+        return tree
+
+    def insert_many(self, items):
+        """
+        Inserimento di un lotto di coppie (chiave, valore): il lotto viene ordinato e,
+        se non è piccolo rispetto all'albero, fuso con il contenuto in ordine e l'albero
+        ricostruito con bulk_load, O(n + m log m); un lotto piccolo (m log n < n) usa insert.
+        A parità di chiave vale l'ultimo valore del lotto.
+        """
+        batch = sorted(items, key=itemgetter(0))  # stabile: i duplicati restano nell'ordine del lotto
+        n = len(self)
+        if len(batch) * n.bit_length() < n:
+            for key, value in batch:
+                self.insert(key, value)
+            return
+        keys, values = _dedup_sorted(_merge_items(self.items(), batch))
+        self.root = _build_balanced(keys, values)
+
+    # ------------------- VISITE E STATISTICHE D'ORDINE ------------------- #
+
+    def __len__(self):
+        return self._size(self.root)
+
+    def __iter__(self):
+        """Chiavi in ordine crescente"""
+        return (key for key, _ in self.items())
+
+    def items(self):
+        """Coppie (chiave, valore) in ordine, generate pigramente (vedi range)"""
+        return self.range()
+
+    def range(self, lo=None, hi=None):
+        """
+        Coppie (chiave, valore) con lo <= chiave < hi in ordine crescente (None = nessun
+        limite), generate pigramente con uno stack esplicito: O(log n) per arrivare alla
+        prima chiave, poi O(1) ammortizzato per elemento, memoria O(altezza).
+        """
+        stack = []
+        node = self.root
+        while True:
+            # scende a sinistra saltando i sottoalberi interamente sotto lo
+            while node:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and node.key >= hi:
+                return
+            yield node.key, node.value
+            node = node.right
+
+    def rank(self, key: int) -> int:
+        """Numero di chiavi minori di key, in O(log n) grazie alle dimensioni dei sottoalberi"""
+        rank = 0
+        node = self.root
+        while node:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += self._size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, k: int):
+        """Coppia (chiave, valore) k-esima (da 0) in ordine crescente, in O(log n)"""
+        if not 0 <= k < len(self):
+            raise IndexError(f"k = {k} fuori dall'intervallo [0, {len(self)})")
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k > left_size:
+                k -= left_size + 1
+                node = node.right
+            else:
+                return node.key, node.value
+
+
+# ------------------------ COSTRUZIONE BILANCIATA ------------------------- #
+
+def _dedup_sorted(items):
+    """Chiavi e valori da coppie ordinate per chiave, tenendo l'ultimo valore di ogni chiave"""
+    keys, values = [], []
+    for key, value in items:
+        if keys and key <= keys[-1]:
+            if key < keys[-1]:
+                raise ValueError(f"chiavi non ordinate: {key} dopo {keys[-1]}")
+            values[-1] = value
+            continue
+        keys.append(key)
+        values.append(value)
+    return keys, values
+
+def _merge_items(old, new):
+    """Fusione di due sequenze di coppie ordinate per chiave; a parità di chiave quelle di new vengono dopo"""
+    old, new = iter(old), iter(new)
+    a, b = next(old, None), next(new, None)
+    while a is not None and b is not None:
+        if b[0] < a[0]:
+            yield b
+            b = next(new, None)
+        else:
+            yield a
+            a = next(old, None)
+    if a is not None:
+        yield a
+        yield from old
+    if b is not None:
+        yield b
+        yield from new
+
+def _build_balanced(keys, values) -> Node:
+    """
+    Albero perfettamente bilanciato sulle chiavi ordinate: la radice di keys[lo:hi]
+    è la mediana. Iterativo: i nodi vengono creati in ordine e collegati con uno stack
+    di intervalli (un sottoalbero di s nodi ha altezza s.bit_length()), senza ricorsione.
+    Il garbage collector è sospeso: milioni di Node nuovi farebbero partire decine di
+    raccolte complete, che da sole costano più della costruzione.
+    """
+    n = len(keys)
+    if n == 0:
+        return None
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        nodes = list(map(Node, keys, values))
+        # intervalli [lo, hi) con almeno due nodi; la radice di ognuno è la mediana
+        stack = [(0, n)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            lo, hi = pop()
+            mid = (lo + hi) // 2
+            node = nodes[mid]
+            size = hi - lo
+            node.size = size
+            node.height = size.bit_length()
+            if lo < mid:
+                node.left = nodes[(lo + mid) // 2]
+                if mid - lo > 1:
+                    push((lo, mid))
+            if mid + 1 < hi:
+                node.right = nodes[(mid + 1 + hi) // 2]
+                if hi - mid > 2:
+                    push((mid + 1, hi))
+        return nodes[n // 2]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+class CompactAVLTree:
+    """
+    AVL con i nodi in array paralleli invece che in oggetti Node: chiave (array 'q'),
+    altezza ('b'), figli sinistro e destro ('i', indici di slot) e valore (lista
+    indicizzata dallo slot). Lo slot 0 è il nodo vuoto (altezza 0), gli slot liberati
+    dalle rimozioni finiscono in una free list e vengono riusati.
+    Inserimento, rimozione e ricerca sono iterativi con uno stack del cammino.
+    Stessa interfaccia di AVLTree (chiavi intere a 64 bit).
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Reset dell'albero"""
+        self.keys = array("q", [0])
+        self.heights = array("b", [0])
+        self.lefts = array("i", [0])
+        self.rights = array("i", [0])
+        self.values = [None]
+        self.free = array("i")
+        self.root = 0
+
+    def __len__(self):
+        return len(self.keys) - 1 - len(self.free)
+
+    def insert(self, key: int, value: str):
+        """Inserimento iterativo: discesa registrando il cammino, poi ribilanciamento risalendo"""
+        keys, lefts, rights = self.keys, self.lefts, self.rights
+        path = []
+        node = self.root
+        while node:
+            if key < keys[node]:
+                path.append(node)
+                node = lefts[node]
+            elif key > keys[node]:
+                path.append(node)
+                node = rights[node]
+            else:
+                self.values[node] = value  # aggiorna il valore se la chiave esiste già
+                return
+        node = self._new_node(key, value)
+        if path:
+            parent = path[-1]
+            if key < keys[parent]:
+                lefts[parent] = node
+            else:
+                rights[parent] = node
+        else:
+            self.root = node
+        self._rebalance_path(path)
+
+    def remove(self, key: int):
+        """Rimozione iterativa tramite chiave (successore in-order se il nodo ha due figli)"""
+        keys, lefts, rights = self.keys, self.lefts, self.rights
+        path = []
+        node = self.root
+        while node and keys[node] != key:
+            path.append(node)
+            node = lefts[node] if key < keys[node] else rights[node]
+        if not node:
+            return
+
+        if lefts[node] and rights[node]:
+            # Due figli: copia il successore nel nodo e rimuovi il successore
+            target = node
+            path.append(node)
+            node = rights[node]
+            while lefts[node]:
+                path.append(node)
+                node = lefts[node]
+            keys[target] = keys[node]
+            self.values[target] = self.values[node]
+
+        child = lefts[node] or rights[node]
+        if path:
+            parent = path[-1]
+            if lefts[parent] == node:
+                lefts[parent] = child
+            else:
+                rights[parent] = child
+        else:
+            self.root = child
+        self._free_node(node)
+        self._rebalance_path(path)
+
+    def find(self, key: int) -> str:
+        """Ricerca del valore associato alla chiave"""
+        result = self._find(key)
+        print(result if result is not None else "NOT FOUND")
+
+    def _find(self, key: int) -> str:
+        """Ricerca iterativa"""
+        keys, lefts, rights = self.keys, self.lefts, self.rights
+        node = self.root
+        while node:
+            k = keys[node]
+            if key == k:
+                return self.values[node]
+            node = lefts[node] if key < k else rights[node]
+        return None
+
+    def show(self):
+        """Mostra l'albero"""
+        print(self._preorder())
+
+    def _preorder(self) -> str:
+        """Stessa forma polacca di AVLTree._preorder, costruita con uno stack"""
+        parts = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not node:
+                parts.append("NULL")
+                continue
+            parts.append(f"{self.keys[node]}:{self.values[node]}:{self.heights[node]}")
+            stack.append(self.rights[node])
+            stack.append(self.lefts[node])
+        return " ".join(parts)
+
+    # ------------------------ FUNZIONI DI SUPPORTO ------------------------- #
+
+    def _new_node(self, key: int, value: str) -> int:
+        """Slot per un nuovo nodo foglia, preso dalla free list se possibile"""
+        if self.free:
+            node = self.free.pop()
+            self.keys[node] = key
+            self.heights[node] = 1
+            self.lefts[node] = self.rights[node] = 0
+            self.values[node] = value
+            return node
+        self.keys.append(key)
+        self.heights.append(1)
+        self.lefts.append(0)
+        self.rights.append(0)
+        self.values.append(value)
+        return len(self.keys) - 1
+
+    def _free_node(self, node: int):
+        self.values[node] = None
+        self.free.append(node)
+
+    def _rebalance_path(self, path):
+        """
+        Aggiorna altezze e ribilancia i nodi del cammino dal basso, ricollegando le nuove radici.
+        Si ferma al primo nodo che resta bilanciato con la stessa altezza: gli antenati non cambiano.
+        """
+        lefts, rights, heights = self.lefts, self.rights, self.heights
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = heights[node]
+            new_root = self._balance(node)
+            if new_root == node:
+                if heights[node] == old_height:
+                    return
+            else:
+                if depth == 0:
+                    self.root = new_root
+                elif lefts[path[depth - 1]] == node:
+                    lefts[path[depth - 1]] = new_root
+                else:
+                    rights[path[depth - 1]] = new_root
+
+    def _update_height(self, node: int):
+        heights = self.heights
+        heights[node] = 1 + max(heights[self.lefts[node]], heights[self.rights[node]])
+
+    def _get_balance(self, node: int) -> int:
+        return self.heights[self.lefts[node]] - self.heights[self.rights[node]]
+
+    def _rotate_left(self, x: int) -> int:
+        """Rotazione a sinistra"""
+        y = self.rights[x]
+        self.rights[x] = self.lefts[y]
+        self.lefts[y] = x
+        self._update_height(x)
+        self._update_height(y)
+        return y
+
+    def _rotate_right(self, y: int) -> int:
+        """Rotazione a destra"""
+        x = self.lefts[y]
+        self.lefts[y] = self.rights[x]
+        self.rights[x] = y
+        self._update_height(y)
+        self._update_height(x)
+        return x
+
+    def _balance(self, node: int) -> int:
+        """Aggiorna l'altezza e applica le rotazioni necessarie (stessi casi di AVLTree._balance)"""
+        self._update_height(node)
+        balance = self._get_balance(node)
+        if balance > 1:
+            if self._get_balance(self.lefts[node]) < 0:
+                self.lefts[node] = self._rotate_left(self.lefts[node])  # caso LR
+            return self._rotate_right(node)  # caso LL
+        if balance < -1:
+            if self._get_balance(self.rights[node]) > 0:
+                self.rights[node] = self._rotate_right(self.rights[node])  # caso RL
+            return self._rotate_left(node)  # caso RR
+        return node
+
+# ------------------------ BENCHMARK DEI BACKEND ------------------------- #
+
+def benchmark_backends(n=200000, seed=0):
+    """
+    Confronta AVLTree e CompactAVLTree su n chiavi casuali: memoria allocata
+    dall'albero (tracemalloc) e operazioni al secondo di insert, find e remove.
+    Restituisce una lista di dizionari e la stampa come tabella.
+    """
+    rng = random.Random(seed)
+    keys = rng.sample(range(n * 10), n)
+    values = [f"v{k}" for k in keys]  # stringhe create fuori dalla misura, condivise dai backend
+    results = []
+    for tree_class in (AVLTree, CompactAVLTree):
+        tracemalloc.start()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        tree = tree_class()
+        t0 = time.perf_counter()
+        for key, value in zip(keys, values):
+            tree.insert(key, value)
+        insert_time = time.perf_counter() - t0
+        memory = tracemalloc.get_traced_memory()[0] - start_memory
+        tracemalloc.stop()
+
+        t0 = time.perf_counter()
+        for key in keys:
+            tree._find(key) if tree_class is CompactAVLTree else tree._find(tree.root, key)
+        find_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for key in keys:
+            tree.remove(key)
+        remove_time = time.perf_counter() - t0
+        results.append({"backend": tree_class.__name__,
+                        "bytes_per_key": memory / n,
+                        "insert_ops": n / insert_time,
+                        "find_ops": n / find_time,
+                        "remove_ops": n / remove_time})
+
+    print(f"n = {n}")
+    print("backend          byte/chiave   insert/s     find/s   remove/s")
+    for r in results:
+        print(f"{r['backend']:<15}  {r['bytes_per_key']:>11.1f}  {r['insert_ops']:>9.0f}  "
+              f"{r['find_ops']:>9.0f}  {r['remove_ops']:>9.0f}")
+    return results
+
+def benchmark_bulk_load(n=10**6, seed=0):
+    """
+    Tempo per caricare n chiavi in AVLTree con n insert, con bulk_load (chiavi già
+    ordinate) e con insert_many (chiavi in ordine casuale). Restituisce i tempi in secondi.
+    """
+    rng = random.Random(seed)
+    keys = rng.sample(range(n * 10), n)
+    items = [(key, f"v{key}") for key in keys]
+    results = {}
+
+    t0 = time.perf_counter()
     tree = AVLTree()
+    for key, value in items:
+        tree.insert(key, value)
+    results["insert"] = time.perf_counter() - t0
+
+    sorted_items = sorted(items)
+    t0 = time.perf_counter()
+    AVLTree.bulk_load(sorted_items)
+    results["bulk_load"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    AVLTree().insert_many(items)
+    results["insert_many"] = time.perf_counter() - t0
+
+    print(f"n = {n}")
+    for name, seconds in results.items():
+        print(f"{name:<12} {seconds:>8.2f} s")
+    return results
+
+def interactive_loop(tree_class=None):
+    """Ciclo interattivo per eseguire i comandi"""
+    tree = (tree_class or AVLTree)()
     while True:
         try:
             command = input("> ").strip()
@@ -206,4 +671,12 @@ def interactive_loop():
             print(f"Errore: {e}")
 
 if __name__ == "__main__":
-    interactive_loop()
\ No newline at end of file
+    # python Es22.py            -> comandi su AVLTree
+    # python Es22.py --compact  -> comandi su CompactAVLTree
+    # python Es22.py bench      -> confronto tra i due backend e caricamento in blocco
+    import sys
+    if "bench" in sys.argv[1:]:
+        benchmark_backends()
+        benchmark_bulk_load()
+    else:
+        interactive_loop(CompactAVLTree if "--compact" in sys.argv[1:] else None)
\ No newline at end of file
@@ -0,0 +1,143 @@
+import os
+import sys
+import mmap
+import time
+import random
+import tempfile
+from multiprocessing import Pool
+
+from bst_stream import validate_preorder
+
+# Blocchi per worker: più blocchi che processi bilanciano righe di lunghezza diversa
+CHUNKS_PER_WORKER = 4
+
+# -------------------------------
+# DIVISIONE DEL FILE SU CONFINI DI RIGA
+# -------------------------------
+
+def line_ranges(path, num_chunks):
+    """
+    Divide il file (un albero serializzato per riga) in al più num_chunks intervalli
+    di byte [start, end) che iniziano e finiscono su un confine di riga. Il file è
+    mappato in memoria: si leggono solo le pagine attorno ai punti di taglio.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            cuts = [0]
+            for c in range(1, num_chunks):
+                newline = mm.find(b"\n", max(size * c // num_chunks, cuts[-1]))
+                if newline == -1:
+                    break
+                if newline + 1 > cuts[-1]:
+                    cuts.append(newline + 1)
+            if cuts[-1] < size:
+                cuts.append(size)
+    return list(zip(cuts, cuts[1:]))
+
+# -------------------------------
+# VALIDAZIONE PARALLELA
+# -------------------------------
+
+def _validate_range(args):
+    """Worker: valida le righe di path[start:end] e restituisce i risultati ("1"/"0" per riga)."""
+    path, start, end = args
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = mm[start:end].splitlines()
+    return b"".join(b"1\n" if validate_preorder(line.split())[0] else b"0\n" for line in lines)
+
+def validate_file(input_path, output_path, workers=None, chunks_per_worker=CHUNKS_PER_WORKER):
+    """
+    Valida tutti gli alberi di input_path (uno per riga, in preordine con NULL) su un
+    pool di workers processi e scrive in output_path una riga 1/0 per albero, nello
+    stesso ordine dell'input. I risultati arrivano per blocchi (imap ordinato) e sono
+    scritti in blocco man mano. Restituisce il numero di alberi validati.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = line_ranges(input_path, workers * chunks_per_worker)
+    count = 0
+    with open(output_path, "wb") as out:
+        if workers == 1:
+            results = map(_validate_range, [(input_path, start, end) for start, end in ranges])
+            for block in results:
+                out.write(block)
+                count += block.count(b"\n")
+            return count
+        with Pool(workers) as pool:
+            for block in pool.imap(_validate_range, [(input_path, start, end) for start, end in ranges]):
+                out.write(block)
+                count += block.count(b"\n")
+    return count
+
+# -------------------------------
+# BENCHMARK DI SCALABILITÀ
+# -------------------------------
+
+def _random_tree(size, rng, valid=True):
+    """
+    Serializzazione in preordine di un BST casuale di size chiavi (invalidata se valid=False).
+    Un albero con meno di due chiavi è sempre un BST: in quel caso valid=False viene ignorato.
+    """
+    if size < 0:
+        raise ValueError(f"size = {size} negativo")
+    tokens = []
+    stack = [sorted(rng.sample(range(size * 10), size))]
+    while stack:
+        keys = stack.pop()
+        if not keys:
+            tokens.append("NULL")
+            continue
+        r = rng.randrange(len(keys))
+        tokens.append(str(keys[r]))
+        stack.append(keys[r + 1:])
+        stack.append(keys[:r])
+    if not valid and size > 1:
+        keys = [i for i, t in enumerate(tokens) if t != "NULL"]
+        tokens[rng.choice(keys)] = str(rng.randrange(size * 10))
+    return " ".join(tokens)
+
+def benchmark_scaling(num_trees=20000, tree_size=200, max_workers=None, num_trials=3):
+    """
+    Genera un file di num_trees alberi e misura validate_file con 1..max_workers processi.
+    Restituisce una lista di dizionari (workers, mean_time, trees_per_s, speedup) e la
+    stampa come tabella.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, "trees.txt")
+        output_path = os.path.join(work_dir, "results.txt")
+        with open(input_path, "w") as f:
+            for _ in range(num_trees):
+                f.write(_random_tree(tree_size, rng, valid=rng.random() < 0.5) + "\n")
+
+        results = []
+        for w in range(1, max_workers + 1):
+            times = []
+            for _ in range(num_trials):
+                t0 = time.perf_counter()
+                validate_file(input_path, output_path, workers=w)
+                times.append(time.perf_counter() - t0)
+            mean_time = sum(times) / len(times)
+            results.append({
+                "workers": w,
+                "mean_time": mean_time,
+                "trees_per_s": num_trees / mean_time,
+                "speedup": results[0]["mean_time"] / mean_time if results else 1.0
+            })
+
+    print(f"{num_trees} alberi da {tree_size} chiavi")
+    print("workers  tempo (s)  alberi/s  speedup vs 1 worker")
+    for r in results:
+        print(f"{r['workers']:>7}  {r['mean_time']:>9.3f}  {r['trees_per_s']:>8.0f}  {r['speedup']:>19.2f}")
+    return results
+
+if __name__ == "__main__":
+    # python bst_batch.py alberi.txt risultati.txt [workers] -> valida il file
+    # python bst_batch.py                                    -> benchmark di scalabilità
+    if len(sys.argv) >= 3:
+        validate_file(sys.argv[1], sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else None)
+    else:
+        benchmark_scaling()
@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+from itertools import chain
+
+# token_blocks è lo stesso tokenizzatore a blocchi dell'ordinamento esterno (Lab_Alg/external_sort.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from external_sort import token_blocks
+
+# Dimensione dei blocchi letti dallo stream binario
+BLOCK_SIZE = 2**20
+NULL = b"NULL"
+
+# -------------------------------
+# TOKENIZZAZIONE PIGRA
+# -------------------------------
+
+def tokens(stream, block_size=BLOCK_SIZE):
+    """Token dello stream uno alla volta (vedi external_sort.token_blocks)."""
+    return chain.from_iterable(token_blocks(stream, block_size))
+
+# -------------------------------
+# VALIDAZIONE ITERATIVA
+# -------------------------------
+
+def validate_preorder(tokens, null=NULL):
+    """
+    Verifica che la serializzazione in preordine (con null per i figli vuoti) sia un BST,
+    come verifica_bst di Es18 ma senza ricorsione: uno stack esplicito contiene gli
+    intervalli (min, max) dei sottoalberi ancora da leggere, quindi la memoria è
+    O(altezza dell'albero) anche con alberi degeneri a cammino.
+    - come in Es18, se i token finiscono prima dell'albero i sottoalberi mancanti
+      valgono null;
+    - come in Es18(alt) (controllo i == n), token in più dopo l'albero lo rendono non valido.
+    Restituisce (1 o 0, token letti).
+    """
+    stack = [(float("-inf"), float("inf"))]
+    pop, push = stack.pop, stack.append
+    count = 0
+    for token in tokens:
+        count += 1
+        if not stack:
+            return 0, count  # token oltre la fine dell'albero
+        min_val, max_val = pop()
+        if token == null:
+            continue
+        key = int(token)
+        if not min_val < key < max_val:
+            return 0, count
+        # il sottoalbero sinistro viene letto per primo: va in cima allo stack
+        push((key, max_val))
+        push((min_val, key))
+    return 1, count
+
+def validate_stream(stream, block_size=BLOCK_SIZE):
+    """
+    Valida l'albero letto dallo stream binario. Restituisce (1 o 0, token letti, token/s).
+    """
+    start = time.perf_counter()
+    valid, count = validate_preorder(tokens(stream, block_size))
+    elapsed = time.perf_counter() - start
+    return valid, count, count / elapsed if elapsed > 0 else float("inf")
+
+if __name__ == "__main__":
+    # python bst_stream.py [file]  (senza file legge lo standard input)
+    # stampa 1/0 su stdout e il throughput su stderr
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as f:
+            valid, count, rate = validate_stream(f)
+    else:
+        valid, count, rate = validate_stream(sys.stdin.buffer)
+    print(valid)
+    print(f"{count} token, {rate:,.0f} token/s", file=sys.stderr)
@@ -0,0 +1,313 @@
+import mmap
+import struct
+from array import array
+from collections import deque
+
+# Dimensione dei blocchi letti dai file
+CHUNK_SIZE = 2**20
+
+# -------------------------------
+# FUNZIONE PREFISSO E Z-FUNCTION
+# -------------------------------
+# Funzionano su str, bytes, bytearray, memoryview e mmap (indicizzabili con len).
+
+def prefix_function(s):
+    """
+    Funzione prefisso (failure function di KMP), come in max_sub_string di Es12:
+    r[i] = lunghezza del più lungo bordo (prefisso proprio che è anche suffisso) di s[:i+1].
+    """
+    n = len(s)
+    r = [0] * n
+    for i in range(1, n):
+        k = r[i - 1]
+        while k > 0 and s[k] != s[i]:
+            k = r[k - 1]
+        if s[k] == s[i]:
+            k += 1
+        r[i] = k
+    return r
+
+def z_function(s):
+    """z[i] = lunghezza del più lungo prefisso comune tra s e s[i:] (z[0] = len(s))."""
+    n = len(s)
+    z = [0] * n
+    if n:
+        z[0] = n
+    left = right = 0
+    for i in range(1, n):
+        k = min(right - i, z[i - left]) if i < right else 0
+        while i + k < n and s[k] == s[i + k]:
+            k += 1
+        z[i] = k
+        if i + k > right:
+            left, right = i, i + k
+    return z
+
+def period(s):
+    """Periodo minimo di s (n meno il bordo più lungo), come max_sub_string di Es12."""
+    return len(s) - prefix_function(s)[-1] if len(s) else 0
+
+# -------------------------------
+# PERIODO IN LINEA SU UN FLUSSO
+# -------------------------------
+
+class PeriodTracker:
+    """
+    Periodo minimo di un flusso che cresce per aggiunte (caratteri, str o blocchi di
+    bytes), senza rielaborare la storia: la funzione prefisso viene estesa di un
+    simbolo alla volta come in prefix_function, O(1) ammortizzato per simbolo.
+    Lo stato sta in due array compatti: i simboli (1 byte ciascuno, 4 se compare un
+    carattere oltre 255) e la funzione prefisso (4 byte, 8 oltre 2^32 simboli);
+    checkpoint() lo serializza e PeriodTracker.restore() lo ricostruisce.
+    """
+    _HEADER = struct.Struct("<4s2sQ")
+    _MAGIC = b"PTR1"
+
+    def __init__(self):
+        self.symbols = array("B")
+        self.failure = array("I")
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def append(self, symbol):
+        """Aggiunge un simbolo (carattere, byte o intero) e restituisce il periodo corrente."""
+        return self.feed((symbol,) if isinstance(symbol, int) else symbol)
+
+    def feed(self, data):
+        """
+        Aggiunge una sequenza di simboli (str, bytes, mmap o un iterabile di interi, anche
+        un generatore) e restituisce il periodo corrente.
+        """
+        if isinstance(data, str):
+            data = [ord(c) for c in data]
+        elif isinstance(data, mmap.mmap):
+            data = memoryview(data)
+        elif not hasattr(data, "__len__"):
+            data = list(data)  # un iteratore va letto una volta sola: _reserve e il ciclo lo scorrono entrambi
+        self._reserve(data)
+        s, r = self.symbols, self.failure
+        for c in data:
+            i = len(s)
+            s.append(c)
+            if i == 0:
+                r.append(0)
+                continue
+            k = r[i - 1]
+            while k > 0 and s[k] != c:
+                k = r[k - 1]
+            if s[k] == c:
+                k += 1
+            r.append(k)
+        return self.period()
+
+    def period(self):
+        """Periodo minimo dei simboli ricevuti finora (0 se il flusso è vuoto)."""
+        return len(self.symbols) - self.failure[-1] if self.symbols else 0
+
+    def _reserve(self, data):
+        """Allarga il tipo degli array se i nuovi simboli o la lunghezza non ci stanno più."""
+        if self.symbols.typecode == "B" and not isinstance(data, (bytes, bytearray, memoryview)) \
+                and any(c > 0xFF for c in data):
+            self.symbols = array("I", self.symbols)
+        if self.failure.typecode == "I" and len(self.failure) + len(data) >= 2**32:
+            self.failure = array("q", self.failure)
+
+    def checkpoint(self):
+        """Stato serializzato (intestazione + array grezzi), da salvare e passare a restore()."""
+        header = self._HEADER.pack(self._MAGIC, (self.symbols.typecode + self.failure.typecode).encode(),
+                                   len(self.symbols))
+        return header + self.symbols.tobytes() + self.failure.tobytes()
+
+    @classmethod
+    def restore(cls, data):
+        """Ricostruisce un PeriodTracker da checkpoint(), senza rielaborare i simboli."""
+        magic, typecodes, n = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC:
+            raise ValueError("checkpoint non valido")
+        tracker = cls()
+        tracker.symbols = array(chr(typecodes[0]))
+        tracker.failure = array(chr(typecodes[1]))
+        start = cls._HEADER.size
+        end = start + n * tracker.symbols.itemsize
+        tracker.symbols.frombytes(data[start:end])
+        tracker.failure.frombytes(data[end:end + n * tracker.failure.itemsize])
+        if len(tracker.failure) != n:
+            raise ValueError("checkpoint troncato")
+        return tracker
+
+# -------------------------------
+# RICERCA KMP
+# -------------------------------
+
+def kmp_search(text, pattern):
+    """Posizioni di inizio (anche sovrapposte) di pattern in text (anche un mmap) con KMP."""
+    return KMPMatcher(pattern).feed(text)
+
+class KMPMatcher:
+    """
+    Ricerca KMP a blocchi: lo stato dell'automa passa da un blocco al successivo,
+    quindi vengono trovate anche le occorrenze a cavallo tra due blocchi, senza
+    tenere in memoria più di un blocco.
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.failure = prefix_function(pattern)
+        self.state = 0
+        self.offset = 0
+
+    def feed(self, chunk):
+        """Restituisce le posizioni (assolute nel flusso) delle occorrenze che terminano in chunk."""
+        matches = []
+        m, failure, pattern = len(self.pattern), self.failure, self.pattern
+        if m == 0:
+            return matches
+        k = self.state
+        for i, c in enumerate(_symbols(chunk)):
+            while k > 0 and pattern[k] != c:
+                k = failure[k - 1]
+            if pattern[k] == c:
+                k += 1
+            if k == m:
+                matches.append(self.offset + i - m + 1)
+                k = failure[k - 1]
+        self.state = k
+        self.offset += len(chunk)
+        return matches
+
+# -------------------------------
+# AHO-CORASICK (MOLTI PATTERN INSIEME)
+# -------------------------------
+
+class AhoCorasick:
+    """
+    Automa di Aho-Corasick per cercare molti pattern in una sola passata:
+    trie dei pattern, link di fallimento (la funzione prefisso generalizzata
+    a un insieme di stringhe) calcolati in ampiezza e, per ogni stato, i pattern
+    che vi terminano. Costo O(lunghezza del testo + occorrenze).
+    Come KMPMatcher, feed() lavora a blocchi mantenendo lo stato tra un blocco e l'altro.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+        for index, pattern in enumerate(self.patterns):
+            if not len(pattern):
+                raise ValueError("pattern vuoto")
+            state = 0
+            for c in pattern:
+                nxt = self.goto[state].get(c)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][c] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = nxt
+            self.out[state] += (index,)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and c not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(c, 0)
+                self.out[nxt] += self.out[self.fail[nxt]]
+
+        self.state = 0
+        self.offset = 0
+
+    def feed(self, chunk):
+        """
+        Restituisce le occorrenze (posizione assoluta di inizio, indice del pattern)
+        che terminano in chunk, in ordine di posizione finale.
+        """
+        matches = []
+        goto, fail, out, patterns = self.goto, self.fail, self.out, self.patterns
+        state = self.state
+        for i, c in enumerate(_symbols(chunk)):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            for index in out[state]:
+                matches.append((self.offset + i - len(patterns[index]) + 1, index))
+        self.state = state
+        self.offset += len(chunk)
+        return matches
+
+    def search(self, text):
+        """Occorrenze in un testo completo (bytes, str o mmap), dall'inizio dell'automa."""
+        self.state = self.offset = 0
+        return self.feed(text)
+
+def _symbols(text):
+    """Iterabile dei simboli di text: un mmap iterato restituisce bytes di lunghezza 1, la sua vista interi."""
+    return memoryview(text) if isinstance(text, mmap.mmap) else text
+
+# -------------------------------
+# RICERCA IN STREAMING SU FILE
+# -------------------------------
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """Blocchi di bytes del file, letti uno alla volta (il file non è mai tutto in memoria)."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def search_stream(chunks, patterns):
+    """
+    Occorrenze (posizione, pattern) di uno o più pattern (bytes) in un flusso di blocchi.
+    Con un solo pattern si usa KMPMatcher, con più pattern AhoCorasick; in entrambi
+    i casi lo stato dell'automa attraversa i confini tra i blocchi.
+    """
+    if isinstance(patterns, (bytes, bytearray)):
+        patterns = [patterns]
+    patterns = [bytes(p) for p in patterns]
+    if len(patterns) == 1:
+        matcher = KMPMatcher(patterns[0])
+        for chunk in chunks:
+            for position in matcher.feed(chunk):
+                yield position, patterns[0]
+    else:
+        automaton = AhoCorasick(patterns)
+        for chunk in chunks:
+            for position, index in automaton.feed(chunk):
+                yield position, patterns[index]
+
+def search_file(path, patterns, chunk_size=CHUNK_SIZE):
+    """Occorrenze (posizione in byte, pattern) dei pattern nel file, letto a blocchi."""
+    return search_stream(read_chunks(path, chunk_size), patterns)
+
+def find_stream(chunks, pattern):
+    """
+    Posizioni di pattern nel flusso con bytes.find (ricerca in C, molto più veloce del
+    ciclo Python di KMP): ogni blocco viene cercato insieme agli ultimi len(pattern) - 1
+    byte del precedente, così le occorrenze a cavallo vengono trovate una sola volta.
+    """
+    m = len(pattern)
+    tail = b""
+    offset = 0  # posizione nel flusso del primo byte di tail
+    for chunk in chunks:
+        window = tail + chunk
+        i = window.find(pattern)
+        while i != -1:
+            yield offset + i
+            i = window.find(pattern, i + 1)
+        keep = min(m - 1, len(window)) if m > 1 else 0
+        offset += len(window) - keep
+        tail = window[len(window) - keep:]
+
+if __name__ == "__main__":
+    # python string_search.py file.log ERROR WARN -> "posizione pattern" per ogni occorrenza
+    import sys
+    for position, pattern in search_file(sys.argv[1], [p.encode() for p in sys.argv[2:]]):
+        print(position, pattern.decode(errors="replace"))
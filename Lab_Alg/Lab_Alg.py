@@ -1,180 +1,23 @@
-import time
-import random
-import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
 import os
+import sys
+import argparse
 
-# -------------------------------
-# IMPLEMENTAZIONE DEGLI ALGORITMI
-# -------------------------------
-
-def quick_sort(arr):
-    if len(arr) <= 1:
-        return arr
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    return quick_sort(left) + middle + quick_sort(right)
-
-def quick_sort_3way(arr):
-    if len(arr) <= 1:
-        return arr
-    pivot = arr[random.randint(0, len(arr) - 1)]
-    lt, eq, gt = [], [], []
-    for x in arr:
-        if x < pivot:
-            lt.append(x)
-        elif x == pivot:
-            eq.append(x)
-        else:
-            gt.append(x)
-    return quick_sort_3way(lt) + eq + quick_sort_3way(gt)
-
-def counting_sort(arr, max_val):
-    if not arr:
-        return []
-    
-    min_val = min(arr)
-    offset = -min_val
-    range_size = max_val - min_val + 1
-    count = [0] * range_size
-    for num in arr:
-        count[num + offset] += 1
-
-    sorted_arr = []
-    for num, freq in enumerate(count):
-        sorted_arr.extend([num - offset] * freq)
-
-    return sorted_arr
-
-def merge_sort(arr):
-    if len(arr) <= 1:
-        return arr
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
-    return merge(left, right)
-
-def merge(left, right):
-    sorted_arr = []
-    i = j = 0
-    while i < len(left) and j < len(right):
-        if left[i] < right[j]:
-            sorted_arr.append(left[i])
-            i += 1
-        else:
-            sorted_arr.append(right[j])
-            j += 1
-    sorted_arr.extend(left[i:])
-    sorted_arr.extend(right[j:])
-    return sorted_arr
-
-# -------------------------------
-# FUNZIONI DI SUPPORTO
-# -------------------------------
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
-def generate_array(n, m):
-    """Genera un array di n interi casuali compresi in [1, m]."""
-    return [random.randint(1, m) for _ in range(n)]
+from Algorithms import build_algorithms
+from grid import ADAPTIVE_OPTIONS, expand_grid, run_grid
 
-def generate_worst_case_array(n, m): # caso di array ordinato
-    """
-    Genera un array 'worst-case': ad esempio, un array ordinato in modo crescente.
-    Per alcuni algoritmi l'input ordinato può rappresentare il caso pessimo
-    """
-    arr = generate_array(n, m)
-    arr.sort()
-    return arr
-
-def clock_resolution():
-    """Stima la risoluzione del clock usando time.perf_counter()."""
-    start = time.perf_counter()
-    while time.perf_counter() == start:
-        pass
-    stop = time.perf_counter()
-    return stop - start
-
-def measure_init_time(n, m, T_min, num_trials=10):
-    """Misura il tempo medio di inizializzazione (generazione dell'array)."""
-    trial_init_times = []
-    for _ in range(num_trials):
-        count = 0
-        total_init_time = 0.0
-        trial_start = time.perf_counter()
-        t0 = time.perf_counter()
-        while True:
-            generate_array(n, m)
-            t1 = time.perf_counter()
-            total_init_time += (t1 - t0)
-            count += 1
-            if (time.perf_counter() - trial_start) >= T_min:
-                break
-        trial_init_times.append(total_init_time / count)
-    return np.mean(trial_init_times)
-
-def measure_sorting_time(sort_func, n, m, T_min, num_trials=10, subtract_init=False, init_time=0.0):
-    """
-    Misura il tempo medio di esecuzione del sort_func su array di dimensione n e range m.
-    Esegue l'algoritmo ripetutamente fino a superare T_min e calcola il tempo medio per iterazione.
-    Se subtract_init=True, viene sottratto il tempo medio di inizializzazione.
-    """
-    trial_times = []
-    for _ in range(num_trials):
-        count = 0
-        total_sort_time = 0.0
-        trial_start = time.perf_counter()
-        t0 = time.perf_counter()
-        while True:
-            arr = generate_array(n, m)
-            sort_func(arr[:])
-            t1 = time.perf_counter()
-            total_sort_time += (t1 - t0)
-            count += 1
-            if (time.perf_counter() - trial_start) >= T_min:
-                break
-        avg_time = total_sort_time / count
-        if subtract_init:
-            avg_time -= init_time
-        trial_times.append(avg_time)
-    mean_time = np.mean(trial_times)
-    std_time = np.std(trial_times)
-    return mean_time, std_time
-
-def measure_sorting_time_worst(sort_func, n, m, T_min, num_trials=10, subtract_init=False, init_time=0.0,
-                               worst_case_generator=generate_worst_case_array):
-    """
-    Misura il tempo medio di esecuzione del sort_func su array worst-case.
-    Funziona come measure_sorting_time(), ma utilizza un input deterministico.
-    """
-    trial_times = []
-    for _ in range(num_trials):
-        count = 0
-        total_sort_time = 0.0
-        trial_start = time.perf_counter()
-        t0 = time.perf_counter()
-        while True:
-            arr = worst_case_generator(n, m)
-            sort_func(arr[:])
-            t1 = time.perf_counter()
-            total_sort_time += (t1 - t0)
-            count += 1
-            if (time.perf_counter() - trial_start) >= T_min:
-                break
-        avg_time = total_sort_time / count
-        if subtract_init:
-            avg_time -= init_time
-        trial_times.append(avg_time)
-    mean_time = np.mean(trial_times)
-    std_time = np.std(trial_times)
-    return mean_time, std_time
+# NumPy, pandas, matplotlib e analysis.py vengono importati solo dai comandi che li usano,
+# così l'avvio della CLI e dei processi worker resta rapido
 
 # -------------------------------
 # FUNZIONE GENERALE PER LA CREAZIONE DEI GRAFICI
 # -------------------------------
 
-def plot_experiment(df, param_col, param_label, title, file_name=None):
+def plot_experiment(df, param_col, param_label, title, file_name=None, show=None):
     """
     Plotta i risultati di un esperimento.
     df: DataFrame con colonne [param_col, 'algorithm', 'mean_time'].
@@ -182,8 +25,9 @@ def plot_experiment(df, param_col, param_label, title, file_name=None):
     param_label: etichetta per l'asse x.
     title: titolo del grafico.
     file_name: se specificato, salva il grafico in un file.
-    log_scale: se True, usa scala logaritmica per entrambi gli assi.
+    show: se True apre la finestra del grafico; di default solo se c'è un display.
     """
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))
     for algo in df['algorithm'].unique():
         subdf = df[df['algorithm'] == algo].sort_values(by=param_col)
@@ -196,10 +40,24 @@ def plot_experiment(df, param_col, param_label, title, file_name=None):
 
     if file_name is not None:
         plt.savefig(file_name, bbox_inches='tight')
-    plt.show()
+    if show if show is not None else not _headless():
+        plt.show()
+    plt.close()
+
+def _headless():
+    """True se non c'è un display (es. server senza X/Wayland)."""
+    return sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+def _pyplot():
+    """Importa matplotlib.pyplot, con il backend Agg (solo file) sulle macchine senza display."""
+    import matplotlib
+    if _headless() and "MPLBACKEND" not in os.environ:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
 
 # -------------------------------
-# ESPERIMENTI
+# ESPERIMENTI DICHIARATI IN UNO SPEC TOML
 # -------------------------------
 
 '''
@@ -207,99 +65,225 @@ def plot_experiment(df, param_col, param_label, title, file_name=None):
 n = numero di elementi nell'array
 m = range min-max tra gli elementi nell'array
 
+Uno spec (vedi specs/experiments.toml) ha una sezione [defaults] e una lista
+[[experiment]]; ogni esperimento eredita i default e definisce:
+  name, output (CSV), plot (PNG), title, xlabel
+  sweep      = {param = "n", start, stop, num, scale = "log"|"linear"} oppure {param, values = [...]}
+  fixed      = parametri costanti, es. {m = 100000}
+  algorithms = lista di nomi di build_algorithms() oppure "all"; anche le operazioni di
+               selection.build_selection_algorithms() (vedi specs/selection.toml)
+  distribution, typed, dtype, num_trials, T_min ("auto" = 10 * risoluzione del clock)
+  distribution = random, sorted, reversed, nearly_sorted, few_unique, organ_pipe, sawtooth,
+               zipf, median_killer (vedi distributions.py); parametri nel nome,
+               es. "nearly_sorted:swaps=10" (vedi specs/distributions.toml)
+  timing     = "fixed" (default, num_trials prove da T_min) oppure "adaptive": warmup,
+               calibrazione delle ripetizioni e campionamento fino a rel_ci_width
+               (ampiezza relativa dell'IC della mediana) o time_budget secondi;
+               opzioni: warmup, rel_ci_width, confidence, min_samples, max_samples, time_budget
+  instrument = true: esecuzione aggiuntiva (non cronometrata) che conta confronti,
+               spostamenti, allocazioni, profondità di ricorsione e memoria di picco
+  isolate    = true: ogni cella in un processo nuovo fissato su una CPU, gc spento durante
+               le misure, ordine casuale delle celle e metadati dell'ambiente nel CSV
+  limits     = {"Counting Sort" = {m = 10000000}}: celle escluse oltre la soglia
+
 '''
 
-def main():
-    # Mostra la directory corrente per verificare dove salvare i file
-    print("Current working directory:", os.getcwd())
-    
-    # Calcola la risoluzione del clock e Tmin
-    R = clock_resolution()
-    T_min = R * 10
-    subtract_init = True
-    
-    # Container per i risultati
-    exp1_results = []  # Esperimento 1: variare n (con m fisso)
-    exp2_results = []  # Esperimento 2: variare m (con n fisso)
-    exp3_results = []  # Esperimento 3: worst-case (variare n, con m fisso)
-    
-    # Esperimento 1: Variare n (con m fisso = 100000)
-    m_fixed = 100000
-    n_values = np.logspace(np.log10(100), np.log10(100000), num=100, dtype=int)
-    algorithms = {
-        "Quick Sort": lambda arr: quick_sort(arr),
-        "Quick Sort 3-Way": lambda arr: quick_sort_3way(arr),
-        "Counting Sort": lambda arr: counting_sort(arr, m_fixed),
-        "Merge Sort": lambda arr: merge_sort(arr),
-        "Sort": lambda arr: arr.sort()
-    }
-    for n in n_values:
-        init_avg = measure_init_time(n, m_fixed, T_min) if subtract_init else 0.0
-        for name, func in algorithms.items():
-            mean_time, std_time = measure_sorting_time(func, n, m_fixed, T_min, subtract_init=subtract_init, init_time=init_avg)
-            rel_error = std_time / mean_time if mean_time > 0 else 0.0
-            exp1_results.append({
-                "experiment": "Exp1",
-                "n": n,
-                "algorithm": name,
-                "mean_time": mean_time,
-                "std_time": std_time,
-                "relative_error": rel_error
-            })
-            
-    df_exp1 = pd.DataFrame(exp1_results)
-    df_exp1.to_csv("experiment1.csv", index=False)
-    plot_experiment(df_exp1, "n", "Dimensione n dell'array", 
-                    "Esperimento 1: Tempo in funzione di n (m fisso)",
-                    file_name="exp1_graph.png")
-    
-    # Esperimento 2: Variare m (con n fisso = 10000)
-    n_fixed = 10000
-    m_values = np.logspace(np.log10(10), np.log10(1000000), num=100, dtype=int)
-    for m_val in m_values:
-        init_avg = measure_init_time(n_fixed, m_val, T_min) if subtract_init else 0.0
-        for name in algorithms.keys():
-            func = (lambda arr, m_val=m_val: counting_sort(arr, m_val)) if name == "Counting Sort" else algorithms[name]
-            mean_time, std_time = measure_sorting_time(func, n_fixed, m_val, T_min, subtract_init=subtract_init, init_time=init_avg)
-            rel_error = std_time / mean_time if mean_time > 0 else 0.0
-            exp2_results.append({
-                "experiment": "Exp2",
-                "m": m_val,
-                "algorithm": name,
-                "mean_time": mean_time,
-                "std_time": std_time,
-                "relative_error": rel_error
-            })
-    df_exp2 = pd.DataFrame(exp2_results)
-    df_exp2.to_csv("experiment2.csv", index=False)
-    plot_experiment(df_exp2, "m", "Intervallo m dei valori", 
-                    "Esperimento 2: Tempo in funzione di m (n fisso)",
-                    file_name="exp2_graph.png")
-    
-    # Esperimento 3: Worst-case: variare n (con m fisso = 100000)
-    m_fixed_wc = 100000
-    n_values_wc = np.logspace(np.log10(100), np.log10(100000), num=100, dtype=int)
-    for n in n_values_wc:
-        init_avg = measure_init_time(n, m_fixed_wc, T_min) if subtract_init else 0.0
-        for name, func in algorithms.items():
-            mean_time, std_time = measure_sorting_time_worst(func, n, m_fixed_wc, T_min,
-                                                              subtract_init=subtract_init, init_time=init_avg)
-            rel_error = std_time / mean_time if mean_time > 0 else 0.0
-            exp3_results.append({
-                "experiment": "Exp3",
-                "n": n,
-                "algorithm": name,
-                "mean_time": mean_time,
-                "std_time": std_time,
-                "relative_error": rel_error
-            })
-    df_exp3 = pd.DataFrame(exp3_results)
-    df_exp3.to_csv("experiment3.csv", index=False)
-    plot_experiment(df_exp3, "n", "Dimensione n dell'array (worst-case)", 
-                    "Esperimento 3: Casi Pessimi con m fisso",
-                    file_name="exp3_graph.png")
-    
-    return df_exp1, df_exp2, df_exp3
+def load_spec(path):
+    """Legge uno spec TOML."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+def sweep_values(sweep):
+    """Valori del parametro variato, esplicitati o generati in scala logaritmica/lineare."""
+    import numpy as np
+    if "values" in sweep:
+        values = [int(v) for v in sweep["values"]]
+    elif sweep.get("scale", "log") == "log":
+        values = np.logspace(np.log10(sweep["start"]), np.log10(sweep["stop"]), num=sweep["num"], dtype=int).tolist()
+    else:
+        values = np.linspace(sweep["start"], sweep["stop"], num=sweep["num"], dtype=int).tolist()
+    return list(dict.fromkeys(values))
+
+def expand_experiment(config, T_min, smoke=False):
+    """Celle della griglia di un esperimento (config = default + campi dell'esperimento)."""
+    param_col = config["sweep"]["param"]
+    values = sweep_values(config["sweep"])
+    if smoke:
+        values = values[:config.get("smoke_points", 3)]
+    algorithms = config.get("algorithms", "all")
+    if algorithms == "all":
+        algorithms = list(build_algorithms().keys())
+    fixed = dict(config.get("fixed", {}))
+    for key in ("distribution", "typed", "dtype", "num_trials", "timing", "instrument") + ADAPTIVE_OPTIONS:
+        if key in config:
+            fixed[key] = config[key]
+    if smoke:
+        # una prova (misura fissa) o pochi campioni (misura adattiva) per punto
+        fixed.update({"num_trials": 1, "warmup": 1, "min_samples": 3, "max_samples": 3})
+    limits = config.get("limits", {})
+
+    def skip(cell):
+        return any(cell[p] > limit for p, limit in limits.get(cell["algorithm"], {}).items())
+
+    return expand_grid(config["name"], param_col, values, fixed, algorithms, T_min, skip)
+
+def run_spec(spec, smoke=False, jobs=None, cpus=None, resume=True, isolate=False):
+    """
+    Esegue tutti gli esperimenti dello spec con run_grid e ne disegna i grafici.
+    Con smoke=True ogni sweep si riduce ai primi smoke_points valori con una sola
+    prova e i file prodotti hanno il suffisso _smoke. isolate (o isolate = true nello
+    spec) misura ogni cella in un processo separato (vedi grid.run_grid).
+    Restituisce {nome esperimento: DataFrame dei risultati}.
+    """
+    from measure_sorting_time import clock_resolution
+    results = {}
+    for config in _experiments(spec):
+        T_min = config.get("T_min", "auto")
+        if T_min == "auto":
+            T_min = clock_resolution() * 10
+        output = _output_name(config, smoke)
+        if not resume and os.path.exists(output):
+            os.remove(output)
+
+        cells = expand_experiment(config, T_min, smoke)
+        run_grid(cells, output, jobs or config.get("jobs"), cpus or config.get("cpus"),
+                 isolate=isolate or config.get("isolate", False))
+        results[config["name"]] = plot_results(config, smoke)
+    return results
+
+def plot_results(config, smoke=False, show=None):
+    """
+    Legge il CSV di un esperimento e, se lo spec indica il file plot, ne disegna il grafico
+    (senza le celle fallite). Restituisce il DataFrame dei risultati.
+    """
+    import pandas as pd
+    df = pd.read_csv(_output_name(config, smoke))
+    if "error" in df.columns:
+        df = df[df["error"].isna()]
+    plot_file = config.get("plot")
+    if plot_file:
+        param_col = config["sweep"]["param"]
+        plot_experiment(df, param_col, config.get("xlabel", param_col), config.get("title", config["name"]),
+                        file_name=_smoke_name(plot_file) if smoke else plot_file, show=show)
+    return df
+
+def plot_spec(spec, smoke=False):
+    """Ridisegna i grafici di tutti gli esperimenti dai CSV già presenti, senza rieseguire le misure."""
+    for config in _experiments(spec):
+        output = _output_name(config, smoke)
+        if not os.path.exists(output):
+            print(f"{config['name']}: {output} non trovato")
+            continue
+        plot_results(config, smoke, show=False)
+        print(f"{config['name']}: {output} -> {config.get('plot')}")
+
+def _experiments(spec):
+    """Configurazioni complete (default + campi propri) degli esperimenti dello spec."""
+    defaults = spec.get("defaults", {})
+    return [{**defaults, **experiment} for experiment in spec["experiment"]]
+
+def _output_name(config, smoke):
+    return _smoke_name(config["output"]) if smoke else config["output"]
+
+def _smoke_name(path):
+    root, ext = os.path.splitext(path)
+    return f"{root}_smoke{ext}"
+
+# -------------------------------
+# ANALISI DEI RISULTATI
+# -------------------------------
+
+def fit_spec(spec, smoke=False):
+    """
+    Adatta i risultati di ogni esperimento dello spec ai modelli di costo e stampa,
+    per ogni algoritmo, il modello migliore con costante, intercetta e R² corretto di tutti i modelli.
+    """
+    from analysis import best_model, fit_cost_models, load_results
+    for config in _experiments(spec):
+        output = _output_name(config, smoke)
+        if not os.path.exists(output):
+            print(f"{config['name']}: {output} non trovato")
+            continue
+        param_col, rows = load_results(output)
+        print(f"{config['name']} ({output})")
+        for algorithm, models in fit_cost_models(rows, param_col, config.get("fixed", {})).items():
+            best = best_model(models)
+            print(f"  {algorithm:22s} migliore: {best}")
+            for name, (a, b, r2) in models.items():
+                print(f"    {name:8s} a = {a:.3e}  b = {b:.3e}  R² corretto = {r2:.4f}")
+
+def compare_runs(base_path, new_path, alpha=None, threshold=None, trials=10):
+    """
+    Confronta due CSV (o due cartelle di CSV) e stampa regressioni e miglioramenti
+    significativi (alpha e threshold di default: quelli di analysis.py).
+    Restituisce il numero di regressioni.
+    """
+    from analysis import DEFAULT_ALPHA, DEFAULT_THRESHOLD, compare_results, load_results, result_pairs
+    alpha = DEFAULT_ALPHA if alpha is None else alpha
+    threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+    regressions = 0
+    for base_file, new_file in result_pairs(base_path, new_path):
+        _, base_rows = load_results(base_file)
+        _, new_rows = load_results(new_file)
+        cells = compare_results(base_rows, new_rows, alpha, threshold, trials)
+        flagged = [c for c in cells if c["status"] != "ok"]
+        print(f"{base_file} -> {new_file}: {len(cells)} celle, "
+              f"{sum(c['status'] == 'regression' for c in cells)} regressioni, "
+              f"{sum(c['status'] == 'improvement' for c in cells)} miglioramenti")
+        for c in flagged:
+            print(f"  {c['status']:11s} {c['experiment']} {c['param']:>10} {c['algorithm']:22s} "
+                  f"{c['base']:.3e} -> {c['new']:.3e} ({c['change']:+.1%}, p = {c['p_value']:.2g})")
+        regressions += sum(c["status"] == "regression" for c in cells)
+    return regressions
+
+# -------------------------------
+# RIGA DI COMANDO
+# -------------------------------
+
+def main(argv=None):
+    """
+    python -m Lab_Alg bench specs/experiments.toml [--smoke] [--jobs N] [--cpus 2,3] [--fresh] [--isolate]
+    python -m Lab_Alg plot specs/experiments.toml [--smoke]
+    python -m Lab_Alg fit specs/experiments.toml [--smoke]
+    python -m Lab_Alg compare CSV . [--alpha 0.05] [--threshold 0.05] [--trials 10]
+    compare esce con codice 1 se trova regressioni significative.
+    """
+    parser = argparse.ArgumentParser(prog="python -m Lab_Alg",
+                                     description="Benchmark degli algoritmi di ordinamento")
+    commands = parser.add_subparsers(dest="command", required=True)
+    bench = commands.add_parser("bench", help="esegue gli esperimenti descritti in uno spec TOML")
+    bench.add_argument("spec", help="file TOML con gli esperimenti")
+    bench.add_argument("--smoke", action="store_true", help="esecuzione rapida su pochi punti")
+    bench.add_argument("--jobs", type=int, help="numero di processi")
+    bench.add_argument("--cpus", help="CPU su cui fissare i processi, es. 2,3")
+    bench.add_argument("--fresh", action="store_true", help="ricrea i CSV invece di riprendere")
+    bench.add_argument("--isolate", action="store_true",
+                       help="ogni cella in un processo nuovo fissato su una CPU, gc spento, ordine casuale")
+    plot = commands.add_parser("plot", help="ridisegna i grafici dai CSV esistenti, senza misurare")
+    plot.add_argument("spec", help="file TOML con gli esperimenti")
+    plot.add_argument("--smoke", action="store_true", help="usa i CSV dell'esecuzione rapida")
+    fit = commands.add_parser("fit", help="adatta i risultati ai modelli di costo n, n log n, n^2, n + m")
+    fit.add_argument("spec", help="file TOML con gli esperimenti")
+    fit.add_argument("--smoke", action="store_true", help="usa i CSV dell'esecuzione rapida")
+    compare = commands.add_parser("compare", help="confronta due esecuzioni e segnala le regressioni")
+    compare.add_argument("base", help="CSV (o cartella di CSV) di riferimento")
+    compare.add_argument("new", help="CSV (o cartella di CSV) da confrontare")
+    compare.add_argument("--alpha", type=float, help="livello di significatività (default 0.05)")
+    compare.add_argument("--threshold", type=float, help="rallentamento relativo minimo da segnalare (default 0.05)")
+    compare.add_argument("--trials", type=int, default=10, help="prove per i CSV senza colonna samples")
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        cpus = [int(c) for c in args.cpus.split(",")] if args.cpus else None
+        run_spec(load_spec(args.spec), smoke=args.smoke, jobs=args.jobs, cpus=cpus, resume=not args.fresh,
+                 isolate=args.isolate)
+    elif args.command == "plot":
+        plot_spec(load_spec(args.spec), smoke=args.smoke)
+    elif args.command == "fit":
+        fit_spec(load_spec(args.spec), smoke=args.smoke)
+    elif args.command == "compare":
+        if compare_runs(args.base, args.new, args.alpha, args.threshold, args.trials):
+            sys.exit(1)
 
 if __name__ == "__main__":
-    df1, df2, df3 = main()
\ No newline at end of file
+    main(sys.argv[1:])
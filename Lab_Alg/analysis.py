@@ -0,0 +1,210 @@
+import os
+import csv
+import math
+import numpy as np
+
+# Modelli di costo candidati: t(n, m) ≈ a * f(n, m) + b ("1" è il tempo costante t ≈ b)
+COST_MODELS = {
+    "1": lambda n, m: np.ones_like(n),
+    "n": lambda n, m: n,
+    "n log n": lambda n, m: n * np.log2(np.maximum(n, 2)),
+    "n^2": lambda n, m: n ** 2,
+    "n + m": lambda n, m: n + m
+}
+DEFAULT_ALPHA = 0.05
+DEFAULT_THRESHOLD = 0.05
+
+# -------------------------------
+# LETTURA DEI RISULTATI
+# -------------------------------
+
+def load_results(path):
+    """
+    Legge un CSV degli esperimenti e restituisce (param_col, righe), dove ogni riga
+    ha experiment, param (int), algorithm, mean_time, std_time e samples (None se
+    il CSV non ha la colonna, come con la misura a T_min fisso). Le celle fallite
+    (colonna error) vengono saltate.
+    """
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        param_col = reader.fieldnames[1]
+        rows = []
+        for row in reader:
+            if row.get("error"):
+                continue  # cella fallita (vedi grid.safe_run_cell): nessun tempo
+            samples = row.get("samples")
+            rows.append({"experiment": row["experiment"],
+                         "param": int(float(row[param_col])),
+                         "algorithm": row["algorithm"],
+                         "mean_time": float(row["mean_time"]),
+                         "std_time": float(row["std_time"]),
+                         "samples": int(float(samples)) if samples else None})
+    return param_col, rows
+
+# -------------------------------
+# FIT DEI MODELLI DI COSTO
+# -------------------------------
+
+def fit_model(x, t):
+    """
+    Minimi quadrati pesati di t ≈ a * x + b con pesi 1/t, cioè sugli errori relativi:
+    con sweep logaritmici i punti piccoli contano quanto quelli grandi.
+    Restituisce (a, b, R²) con R² calcolato sugli stessi residui relativi.
+    """
+    w = 1.0 / t
+    A = np.column_stack((x * w, w))
+    (a, b), *_ = np.linalg.lstsq(A, np.ones_like(t), rcond=None)
+    residuals = 1.0 - A @ (a, b)
+    # R² rispetto al modello costante migliore (t ≈ c, sempre pesato 1/t)
+    c = np.sum(w) / np.sum(w * w)
+    baseline = 1.0 - c * w
+    total = np.sum(baseline ** 2)
+    r2 = 1.0 - np.sum(residuals ** 2) / total if total > 0 else 0.0
+    return float(a), float(b), float(r2)
+
+def fit_constant(t):
+    """Modello costante t ≈ b (pesi 1/t come fit_model): (0, b, 0), R² nullo per definizione."""
+    w = 1.0 / t
+    return 0.0, float(np.sum(w) / np.sum(w * w)), 0.0
+
+def adjusted_r2(r2, points, parameters=1):
+    """R² corretto per il numero di parametri oltre l'intercetta: il modello costante vale 0."""
+    return 1.0 - (1.0 - r2) * (points - 1) / (points - parameters - 1)
+
+def _is_affine(x, y):
+    """True se x = α y + β sullo sweep: i due modelli darebbero lo stesso fit."""
+    A = np.column_stack((y, np.ones_like(y)))
+    coef, *_ = np.linalg.lstsq(A, x, rcond=None)
+    return np.allclose(A @ coef, x, rtol=1e-9, atol=0.0)
+
+def fit_cost_models(rows, param_col, fixed):
+    """
+    Adatta ogni algoritmo ai modelli di COST_MODELS.
+    fixed: parametri costanti dell'esperimento (es. {"m": 100000}). Vengono saltati
+    i modelli che dipendono da un parametro mancante, che sono costanti nello sweep
+    o che sono funzione affine di un modello precedente (con m fisso "n + m" è "n"
+    traslato): darebbero lo stesso R². Il modello costante "1" c'è sempre, così anche
+    con n fisso (Exp2) "n + m" ha un'alternativa.
+    Restituisce {algoritmo: {modello: (a, b, R² corretto)}}: l'R² corretto penalizza
+    il parametro a, quindi un tempo piatto preferisce "1". I tempi non positivi
+    sono scartati.
+    """
+    by_algorithm = {}
+    for row in rows:
+        if row["mean_time"] > 0:
+            by_algorithm.setdefault(row["algorithm"], []).append((row["param"], row["mean_time"]))
+
+    fits = {}
+    for algorithm, points in by_algorithm.items():
+        params = np.array([p for p, _ in points], dtype=float)
+        t = np.array([time for _, time in points])
+        values = {**{k: float(v) for k, v in fixed.items()}, param_col: params}
+        if "n" not in values or "m" not in values or len(points) < 3:
+            continue
+        fits[algorithm] = {}
+        candidates = []
+        for name, model in COST_MODELS.items():
+            x = np.broadcast_to(model(values["n"], values["m"]), t.shape).astype(float)
+            if np.ptp(x) == 0:
+                if name == "1":
+                    fits[algorithm][name] = fit_constant(t)
+                continue
+            if any(_is_affine(x, y) for y in candidates):
+                continue
+            candidates.append(x)
+            a, b, r2 = fit_model(x, t)
+            fits[algorithm][name] = (a, b, adjusted_r2(r2, len(t)))
+    return fits
+
+def best_model(models):
+    """Modello con R² (corretto) massimo."""
+    return max(models, key=lambda name: models[name][2])
+
+# -------------------------------
+# CONFRONTO TRA DUE ESECUZIONI
+# -------------------------------
+
+def _betainc(a, b, x):
+    """Funzione beta incompleta regolarizzata I_x(a, b) (frazione continua di Lentz)."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _betainc(b, a, 1.0 - x)
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log1p(-x)) / a
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for k in range(1, 300):
+        for numerator in (k * (b - k) * x / ((a + 2 * k - 1) * (a + 2 * k)),
+                          -(a + k) * (a + b + k) * x / ((a + 2 * k) * (a + 2 * k + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return front * result
+
+def t_sf(t, df):
+    """P(T > t) per una t di Student con df gradi di libertà."""
+    tail = 0.5 * _betainc(df / 2, 0.5, df / (df + t * t))
+    return tail if t > 0 else 1.0 - tail
+
+def welch_test(mean1, std1, n1, mean2, std2, n2):
+    """
+    Test t di Welch unilaterale per H1: mean2 > mean1 (rallentamento).
+    Restituisce (t, gradi di libertà, p-value).
+    """
+    v1, v2 = std1 ** 2 / n1, std2 ** 2 / n2
+    se = math.sqrt(v1 + v2)
+    if se == 0:
+        return math.inf if mean2 > mean1 else -math.inf, math.inf, 0.0 if mean2 > mean1 else 1.0
+    t = (mean2 - mean1) / se
+    # Welch-Satterthwaite (con una sola prova la varianza non contribuisce)
+    denominator = sum(v * v / (k - 1) for v, k in ((v1, n1), (v2, n2)) if k > 1)
+    df = max((v1 + v2) ** 2 / denominator, 1.0) if denominator > 0 else 1.0
+    return t, df, t_sf(t, df)
+
+def compare_results(base_rows, new_rows, alpha=DEFAULT_ALPHA, threshold=DEFAULT_THRESHOLD, trials=10):
+    """
+    Confronta cella per cella (experiment, parametro, algoritmo) due insiemi di risultati.
+    Una cella è una regressione se il nuovo tempo medio è più alto di oltre
+    threshold (relativo) e il test di Welch lo rende significativo a livello alpha;
+    simmetricamente un miglioramento. trials è il numero di prove assunto per i
+    CSV senza colonna samples. Restituisce la lista delle celle confrontate
+    (dizionari con base, new, change, p_value e status).
+    """
+    base = {(r["experiment"], r["param"], r["algorithm"]): r for r in base_rows}
+    cells = []
+    for row in new_rows:
+        old = base.get((row["experiment"], row["param"], row["algorithm"]))
+        if old is None or old["mean_time"] <= 0 or row["mean_time"] <= 0:
+            continue
+        n1, n2 = old["samples"] or trials, row["samples"] or trials
+        _, _, p_slower = welch_test(old["mean_time"], old["std_time"], n1, row["mean_time"], row["std_time"], n2)
+        _, _, p_faster = welch_test(row["mean_time"], row["std_time"], n2, old["mean_time"], old["std_time"], n1)
+        change = row["mean_time"] / old["mean_time"] - 1.0
+        status = "ok"
+        if change > threshold and p_slower < alpha:
+            status = "regression"
+        elif change < -threshold and p_faster < alpha:
+            status = "improvement"
+        cells.append({"experiment": row["experiment"], "param": row["param"], "algorithm": row["algorithm"],
+                      "base": old["mean_time"], "new": row["mean_time"], "change": change,
+                      "p_value": p_slower if change > 0 else p_faster, "status": status})
+    return cells
+
+def result_pairs(base_path, new_path):
+    """
+    Coppie di CSV da confrontare: due file, oppure due cartelle (i CSV con lo stesso nome).
+    """
+    if not os.path.isdir(base_path):
+        return [(base_path, new_path)]
+    names = sorted(name for name in os.listdir(base_path)
+                   if name.endswith(".csv") and os.path.exists(os.path.join(new_path, name)))
+    return [(os.path.join(base_path, name), os.path.join(new_path, name)) for name in names]
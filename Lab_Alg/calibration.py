@@ -0,0 +1,151 @@
+import sys
+import csv
+import json
+import time
+import random
+
+from Algorithms import (ADAPTIVE_DEFAULTS, ADAPTIVE_ENGINES, ADAPTIVE_THRESHOLDS_FILE,
+                        counting_sort_np, radix_sort, natural_merge_sort, set_adaptive_thresholds)
+
+COMPARISON_ENGINES = ("Intro Sort", "Natural Merge Sort")
+
+# -------------------------------
+# SOGLIE DAI CSV DEGLI ESPERIMENTI
+# -------------------------------
+
+def read_results(path, param_col):
+    """
+    Legge un CSV degli esperimenti e restituisce {parametro: {motore: tempo}}.
+    Si tengono solo le righe dei motori che adaptive_sort esegue davvero
+    (ADAPTIVE_ENGINES): i tempi di un altro algoritmo, es. il counting sort in
+    Python puro al posto di Counting Sort NumPy, darebbero soglie sbagliate.
+    I tempi non positivi, prodotti dalla vecchia sottrazione del tempo di
+    inizializzazione, vengono scartati.
+    """
+    table = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            if row.get("error"):
+                continue
+            engine = row["algorithm"]
+            mean_time = float(row["mean_time"])
+            if engine not in ADAPTIVE_ENGINES or not mean_time > 0:
+                continue
+            table.setdefault(int(float(row[param_col])), {})[engine] = mean_time
+    return table
+
+def thresholds_from_csv(exp1_path, exp2_path, exp3_path, n_fixed=10000):
+    """
+    Ricava le soglie di adaptive_sort dai CSV di Exp1-Exp3:
+    - counting_ratio: massimo m/n (Exp2, n fisso) in cui il counting sort
+      non è più lento del miglior ordinamento per confronti;
+    - default_engine: ordinamento per confronti più veloce al massimo n di Exp1;
+    - presorted_engine: ordinamento per confronti più veloce al massimo n di Exp3
+      (input ordinato).
+    Una soglia si ricava solo se i CSV contengono i motori di adaptive_sort
+    (come quelli scritti da python -m Lab_Alg bench specs/experiments.toml).
+    """
+    thresholds = {}
+
+    exp2 = read_results(exp2_path, "m")
+    crossover = None
+    for m in sorted(exp2):
+        times = exp2[m]
+        comparison = [times[e] for e in COMPARISON_ENGINES if e in times]
+        if "Counting Sort NumPy" in times and comparison and times["Counting Sort NumPy"] <= min(comparison):
+            crossover = m
+    if crossover is not None:
+        thresholds["counting_ratio"] = crossover / n_fixed
+
+    exp1 = read_results(exp1_path, "n")
+    largest = exp1[max(exp1)] if exp1 else {}
+    candidates = {e: t for e, t in largest.items() if e in COMPARISON_ENGINES}
+    if candidates:
+        thresholds["default_engine"] = min(candidates, key=candidates.get)
+
+    exp3 = read_results(exp3_path, "n")
+    largest = exp3[max(exp3)] if exp3 else {}
+    candidates = {e: t for e, t in largest.items() if e in COMPARISON_ENGINES}
+    if candidates:
+        thresholds["presorted_engine"] = min(candidates, key=candidates.get)
+
+    return thresholds
+
+# -------------------------------
+# RICALIBRAZIONE SULLA MACCHINA CORRENTE
+# -------------------------------
+
+def _best_time(sort_func, data, num_trials=3):
+    """Tempo minimo di sort_func su num_trials copie di data."""
+    best = float("inf")
+    for _ in range(num_trials):
+        arr = data[:]
+        t0 = time.perf_counter()
+        sort_func(arr)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def calibrate(n=20000, num_trials=3):
+    """
+    Misura i punti di incrocio tra i motori su questa macchina e restituisce
+    le soglie di adaptive_sort (default_engine, counting_ratio, radix_min_n,
+    presorted_fraction).
+    """
+    rng = random.Random(0)
+    thresholds = {}
+
+    data = [rng.randint(1, 10**9) for _ in range(n)]
+    times = {e: _best_time(ADAPTIVE_ENGINES[e], data, num_trials) for e in COMPARISON_ENGINES}
+    default_engine = min(times, key=times.get)
+    thresholds["default_engine"] = default_engine
+    default_sort = ADAPTIVE_ENGINES[default_engine]
+
+    # Counting sort: massimo rapporto intervallo/n in cui batte radix e confronti
+    thresholds["counting_ratio"] = ADAPTIVE_DEFAULTS["counting_ratio"]
+    for ratio in (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128):
+        data = [rng.randint(1, int(ratio * n)) for _ in range(n)]
+        t_counting = _best_time(counting_sort_np, data, num_trials)
+        if t_counting <= min(_best_time(radix_sort, data, num_trials),
+                             _best_time(default_sort, data, num_trials)):
+            thresholds["counting_ratio"] = ratio
+
+    # Radix sort: minimo n (valori fino a 10^9) in cui batte gli ordinamenti per confronti
+    thresholds["radix_min_n"] = ADAPTIVE_DEFAULTS["radix_min_n"]
+    for size in (2**k for k in range(7, 18)):
+        data = [rng.randint(1, 10**9) for _ in range(size)]
+        if _best_time(radix_sort, data, num_trials) < _best_time(default_sort, data, num_trials):
+            thresholds["radix_min_n"] = size
+            break
+
+    # Input quasi ordinati: minima quota di coppie in ordine per cui il merge naturale batte l'introsort
+    thresholds["presorted_fraction"] = ADAPTIVE_DEFAULTS["presorted_fraction"]
+    intro_sort = ADAPTIVE_ENGINES["Intro Sort"]
+    for swaps in (0.2, 0.1, 0.05, 0.02, 0.01, 0.001):
+        data = list(range(n))
+        for _ in range(int(swaps * n)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            data[i], data[j] = data[j], data[i]
+        if _best_time(natural_merge_sort, data, num_trials) < _best_time(intro_sort, data, num_trials):
+            ascending = sum(1 for i in range(n - 1) if not data[i + 1] < data[i]) / (n - 1)
+            thresholds["presorted_fraction"] = round(ascending, 3)
+            break
+
+    return thresholds
+
+def save_thresholds(thresholds, path=ADAPTIVE_THRESHOLDS_FILE):
+    """Salva le soglie in JSON (le legge adaptive_sort) e le rende subito attive."""
+    with open(path, "w") as f:
+        json.dump(thresholds, f, indent=4)
+    set_adaptive_thresholds(thresholds)
+
+if __name__ == "__main__":
+    # python calibration.py csv [exp1.csv exp2.csv exp3.csv] -> soglie dai CSV di bench
+    #                                                           (default exp1-3_results.csv)
+    # python calibration.py measure                          -> soglie misurate su questa macchina
+    if len(sys.argv) > 1 and sys.argv[1] == "csv":
+        paths = sys.argv[2:5] or ["exp1_results.csv", "exp2_results.csv", "exp3_results.csv"]
+        thresholds = thresholds_from_csv(*paths)
+    else:
+        thresholds = calibrate()
+    save_thresholds(thresholds)
+    print(json.dumps(thresholds, indent=4))
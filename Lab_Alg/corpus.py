@@ -0,0 +1,34 @@
+import os
+import numpy as np
+
+from distributions import generate
+
+# Cartella in cui vengono salvati gli input generati
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+# -------------------------------
+# CACHE SU DISCO
+# -------------------------------
+
+def corpus_path(distribution, n, m, seed, dtype="int64", cache_dir=CORPUS_DIR):
+    """Percorso del file .npy associato alla chiave (distribuzione, n, m, seed, dtype)."""
+    folder = distribution.replace(":", "_").replace(",", "_").replace("=", "")
+    return os.path.join(cache_dir, folder, f"n{n}_m{m}_s{seed}_{dtype}.npy")
+
+def load_input(distribution, n, m, seed=0, dtype="int64", cache_dir=CORPUS_DIR):
+    """
+    Restituisce l'input identificato da (distribution, n, m, seed) come ndarray
+    in sola lettura mappato in memoria dal file .npy. Se il file non esiste
+    l'input viene generato e salvato (con una rinomina atomica, così processi
+    concorrenti non leggono mai un file incompleto).
+    """
+    n, m = int(n), int(m)
+    path = corpus_path(distribution, n, m, seed, dtype, cache_dir)
+    if not os.path.exists(path):
+        data = generate(distribution, n, m, seed, dtype)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp_path, path)
+    return np.load(path, mmap_mode="r")
@@ -0,0 +1,120 @@
+import numpy as np
+
+# -------------------------------
+# DISTRIBUZIONI DI INPUT (VETTORIALI, RIPRODUCIBILI DAL SEED)
+# -------------------------------
+# Ogni generatore ha firma (n, m, rng, dtype, **parametri) e restituisce un ndarray
+# di n interi in [1, m]; rng è un np.random.Generator.
+
+def random_input(n, m, rng, dtype="int64"):
+    """n interi casuali uniformi in [1, m]."""
+    return rng.integers(1, m + 1, size=n, dtype=dtype)
+
+def sorted_input(n, m, rng, dtype="int64"):
+    """n interi casuali in [1, m] ordinati in modo crescente (caso pessimo di Exp3)."""
+    data = random_input(n, m, rng, dtype)
+    data.sort()
+    return data
+
+def reversed_input(n, m, rng, dtype="int64"):
+    """n interi casuali in [1, m] ordinati in modo decrescente."""
+    return np.ascontiguousarray(sorted_input(n, m, rng, dtype)[::-1])
+
+def nearly_sorted_input(n, m, rng, dtype="int64", swaps=None):
+    """Input ordinato con swaps scambi di posizioni casuali (default: n // 100, almeno 1)."""
+    data = sorted_input(n, m, rng, dtype)
+    if n < 2:
+        return data
+    swaps = max(1, n // 100) if swaps is None else int(swaps)
+    i = rng.integers(0, n, size=swaps)
+    j = rng.integers(0, n, size=swaps)
+    for a, b in zip(i.tolist(), j.tolist()):
+        data[a], data[b] = data[b], data[a]
+    return data
+
+def few_unique_input(n, m, rng, dtype="int64", unique=10):
+    """n interi estratti da soli unique valori distinti di [1, m] (molti duplicati)."""
+    values = random_input(int(unique), m, rng, dtype)
+    return values[rng.integers(0, len(values), size=n)]
+
+def organ_pipe_input(n, m, rng, dtype="int64"):
+    """Prima metà crescente e seconda metà decrescente (forma a canna d'organo)."""
+    data = sorted_input(n, m, rng, dtype)
+    return np.concatenate((data[::2], data[1::2][::-1]))
+
+def sawtooth_input(n, m, rng, dtype="int64", teeth=8):
+    """teeth tratti consecutivi, ognuno ordinato in modo crescente (dente di sega)."""
+    data = random_input(n, m, rng, dtype)
+    segment = np.arange(n) * int(teeth) // max(n, 1)
+    return data[np.lexsort((data, segment))]
+
+def zipf_input(n, m, rng, dtype="int64", a=1.5):
+    """Valori con distribuzione di Zipf di esponente a, troncati a m (pochi valori molto frequenti)."""
+    return np.minimum(rng.zipf(float(a), size=n), m).astype(dtype)
+
+def median_killer_input(n, m, rng, dtype="int64"):
+    """
+    Input avversario per quick_sort (pivot nell'elemento centrale): simula l'algoritmo
+    e assegna a ogni pivot scelto il massimo valore rimasto, così ogni partizione
+    separa un solo elemento e la ricorsione ha profondità n (tempo quadratico).
+    La posizione del pivot tra gli elementi rimasti si trova con un albero di
+    Fenwick, in O(n log n). Con m >= n i valori sono distinti; rng non viene usato
+    perché l'input è determinato da n e m.
+    """
+    # tree[i] = numero di posizioni ancora presenti nel blocco (i - lowbit(i), i]
+    idx = np.arange(n + 1)
+    tree = (idx & -idx).tolist()
+    top = 1 << max(n, 1).bit_length()
+    ranks = np.empty(n, dtype=np.int64)
+    for remaining in range(n, 0, -1):
+        # posizione (1-based) del (remaining // 2 + 1)-esimo elemento rimasto
+        k = remaining // 2 + 1
+        pos = 0
+        step = top
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] < k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        ranks[pos] = remaining
+        pos += 1
+        while pos <= n:
+            tree[pos] -= 1
+            pos += pos & -pos
+    return (1 + (ranks - 1) * (m - 1) // max(n - 1, 1)).astype(dtype)
+
+GENERATORS = {
+    "random": random_input,
+    "sorted": sorted_input,
+    "reversed": reversed_input,
+    "nearly_sorted": nearly_sorted_input,
+    "few_unique": few_unique_input,
+    "organ_pipe": organ_pipe_input,
+    "sawtooth": sawtooth_input,
+    "zipf": zipf_input,
+    "median_killer": median_killer_input
+}
+
+# -------------------------------
+# SELEZIONE PER NOME
+# -------------------------------
+
+def parse_distribution(distribution):
+    """
+    Separa nome e parametri di una distribuzione: "nearly_sorted:swaps=10"
+    -> ("nearly_sorted", {"swaps": 10.0}); "zipf:a=1.2" -> ("zipf", {"a": 1.2}).
+    """
+    name, _, params = distribution.partition(":")
+    if name not in GENERATORS:
+        raise ValueError(f"Distribuzione sconosciuta: {name} (disponibili: {', '.join(GENERATORS)})")
+    kwargs = {}
+    for item in filter(None, params.split(",")):
+        key, _, value = item.partition("=")
+        kwargs[key.strip()] = float(value)
+    return name, kwargs
+
+def generate(distribution, n, m, seed=0, dtype="int64"):
+    """Genera l'input (ndarray) della distribuzione indicata, riproducibile da seed."""
+    name, kwargs = parse_distribution(distribution)
+    return GENERATORS[name](int(n), int(m), np.random.default_rng(seed), dtype, **kwargs)
@@ -0,0 +1,206 @@
+import os
+import mmap
+import heapq
+import tempfile
+from array import array
+
+# Interi a 64 bit con segno, come array('q')
+ITEM_SIZE = 8
+# Stima dei byte occupati in memoria da un int Python in una lista durante l'ordinamento
+# (puntatore + oggetto int + posizione nel buffer ausiliario del merge sort)
+PY_INT_BYTES = 48
+DEFAULT_MEMORY_BUDGET = 64 * 2**20
+# Massimo numero di run fusi insieme in una passata
+MAX_FAN_IN = 64
+# Dimensione dei blocchi letti dai file di testo
+TEXT_BLOCK = 2**20
+
+# -------------------------------
+# LETTURA E SCRITTURA A BLOCCHI
+# -------------------------------
+
+def read_chunks(path, chunk_items, fmt="binary"):
+    """
+    Legge il file a blocchi di al più chunk_items interi (liste Python).
+    fmt="binary": interi a 64 bit nativi letti via mmap; un file la cui dimensione
+    non è multipla di ITEM_SIZE è troncato e solleva ValueError (nessun dato perso in silenzio);
+    fmt="text": interi separati da spazi o a capo, letti a blocchi bufferizzati.
+    """
+    if fmt == "binary":
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size % ITEM_SIZE:
+                raise ValueError(f"{path}: {size} byte non sono un multiplo di {ITEM_SIZE} (file troncato?)")
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                step = chunk_items * ITEM_SIZE
+                for offset in range(0, size, step):
+                    chunk = array("q")
+                    chunk.frombytes(mm[offset:offset + step])
+                    yield chunk.tolist()
+    else:
+        chunk = []
+        for value in _read_text_ints(path):
+            chunk.append(value)
+            if len(chunk) == chunk_items:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def token_blocks(stream, block_size=TEXT_BLOCK):
+    """
+    Liste di token (bytes) lette a blocchi da uno stream binario (file aperto in "rb",
+    sys.stdin.buffer): in memoria c'è un solo blocco alla volta. Un token a cavallo
+    tra due blocchi viene ricomposto. Usato anche da Esercizi/bst_stream.py.
+    """
+    tail = b""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        tokens = (tail + block).split()
+        # l'ultimo token potrebbe continuare nel blocco successivo
+        tail = tokens.pop() if tokens and not block[-1:].isspace() else b""
+        yield tokens
+    if tail:
+        yield [tail]
+
+def _read_text_ints(path):
+    """Interi di un file di testo, letti a blocchi con token_blocks."""
+    with open(path, "rb") as f:
+        for tokens in token_blocks(f):
+            yield from map(int, tokens)
+
+def _read_run(path, buffer_items):
+    """Valori di un run binario letti a blocchi di buffer_items interi."""
+    with open(path, "rb") as f:
+        while True:
+            block = array("q")
+            block.frombytes(f.read(buffer_items * ITEM_SIZE))
+            if not block:
+                return
+            yield from block
+
+def _write_run(values, path):
+    """Scrive un run ordinato (lista o iterabile di interi) in formato binario."""
+    with open(path, "wb") as f:
+        if isinstance(values, list):
+            array("q", values).tofile(f)
+            return
+        block = array("q")
+        for value in values:
+            block.append(value)
+            if len(block) >= 2**16:
+                block.tofile(f)
+                block = array("q")
+        block.tofile(f)
+
+def _write_output(values, path, fmt):
+    """Scrive l'output finale nel formato richiesto, a blocchi."""
+    if fmt == "binary":
+        _write_run(values, path)
+        return
+    with open(path, "w", buffering=TEXT_BLOCK) as f:
+        lines = []
+        for value in values:
+            lines.append(str(value))
+            if len(lines) >= 2**16:
+                f.write("\n".join(lines) + "\n")
+                lines = []
+        if lines:
+            f.write("\n".join(lines) + "\n")
+
+# -------------------------------
+# FUSIONE K-WAY
+# -------------------------------
+
+def merge_runs(iterators):
+    """
+    Fusione k-way con uno heap di (valore, indice del run): generalizza merge()
+    di Algorithms.py a k sequenze ordinate, con la stessa regola per le parità:
+    a parità di valore esce prima l'elemento del run con indice minore (per
+    merge() il run sinistro), quindi la fusione è stabile.
+    """
+    heap = []
+    for r, it in enumerate(iterators):
+        for value in it:
+            heap.append((value, r, it))
+            break
+    heapq.heapify(heap)
+    while heap:
+        value, r, it = heap[0]
+        yield value
+        for value in it:
+            heapq.heapreplace(heap, (value, r, it))
+            break
+        else:
+            heapq.heappop(heap)
+
+# -------------------------------
+# ORDINAMENTO ESTERNO
+# -------------------------------
+
+def external_sort(input_path, output_path, memory_budget=DEFAULT_MEMORY_BUDGET, fmt="binary",
+                  sort_func=None, tmp_dir=None, max_fan_in=MAX_FAN_IN):
+    """
+    Ordina un file di interi che non entra in memoria.
+    1. legge blocchi di memory_budget // PY_INT_BYTES interi, li ordina con
+       sort_func (default natural_merge_sort) e li scrive come run temporanei;
+    2. fonde i run a gruppi di max_fan_in con merge_runs finché ne resta uno,
+       leggendo ogni run con un buffer di memory_budget / (fan-in + 1) byte.
+    L'output ha lo stesso formato dell'input. Restituisce il numero di elementi.
+    """
+    if sort_func is None:
+        from Algorithms import natural_merge_sort
+        sort_func = natural_merge_sort
+    chunk_items = max(1, memory_budget // PY_INT_BYTES)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        runs = []
+        count = 0
+        for chunk in read_chunks(input_path, chunk_items, fmt):
+            sorted_chunk = sort_func(chunk)
+            if sorted_chunk is None:  # ordinamento in-place (es. list.sort)
+                sorted_chunk = chunk
+            path = os.path.join(work_dir, f"run{len(runs)}.bin")
+            _write_run(list(sorted_chunk), path)
+            runs.append(path)
+            count += len(chunk)
+
+        generation = 0
+        while len(runs) > max_fan_in:
+            merged = []
+            for g in range(0, len(runs), max_fan_in):
+                group = runs[g:g + max_fan_in]
+                path = os.path.join(work_dir, f"merge{generation}_{len(merged)}.bin")
+                _write_run(merge_runs(_open_runs(group, memory_budget)), path)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            generation += 1
+
+        _write_output(merge_runs(_open_runs(runs, memory_budget)), output_path, fmt)
+    return count
+
+def _open_runs(paths, memory_budget):
+    """Lettori bufferizzati dei run, con il budget di memoria diviso tra i run e l'output."""
+    buffer_items = max(1, memory_budget // ((len(paths) + 1) * PY_INT_BYTES))
+    return [_read_run(path, buffer_items) for path in paths]
+
+def external_sort_array(arr, memory_budget=2**20):
+    """
+    Adattatore per l'harness degli esperimenti: scrive arr su un file
+    temporaneo, lo ordina con external_sort e restituisce la lista ordinata.
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, "input.bin")
+        output_path = os.path.join(work_dir, "output.bin")
+        _write_run(list(arr), input_path)
+        external_sort(input_path, output_path, memory_budget=memory_budget)
+        result = array("q")
+        with open(output_path, "rb") as f:
+            result.frombytes(f.read())
+    return result.tolist()
@@ -0,0 +1,193 @@
+import os
+import sys
+import csv
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Manager
+
+from Algorithms import build_algorithms
+
+RESULT_COLUMNS = ["experiment", "{param}", "algorithm", "mean_time", "std_time", "relative_error",
+                  "median_time", "ci_low", "ci_high", "samples",
+                  "comparisons", "moves", "allocations", "max_depth", "peak_memory",
+                  "cpu", "cpu_model", "governor", "python_version", "error"]
+# Opzioni dello spec passate al motore di misura adattivo
+ADAPTIVE_OPTIONS = ("warmup", "rel_ci_width", "confidence", "min_samples", "max_samples", "time_budget")
+
+# -------------------------------
+# ESPANSIONE DELLA GRIGLIA
+# -------------------------------
+
+def expand_grid(experiment, param_col, values, fixed, algorithms, T_min, skip=None):
+    """
+    Espande un esperimento in celle indipendenti, una per (valore del parametro, algoritmo).
+    fixed contiene i parametri costanti (es. {"m": 100000} o {"n": 10000, "distribution": "sorted"});
+    skip(cell) -> True esclude la cella (es. counting sort puro con m troppo grande).
+    """
+    cells = []
+    for value in values:
+        for name in algorithms:
+            cell = {"experiment": experiment, "param_col": param_col, param_col: int(value),
+                    "algorithm": name, "T_min": T_min, **fixed}
+            if skip is None or not skip(cell):
+                cells.append(cell)
+    return cells
+
+def cell_key(cell):
+    """Chiave che identifica una cella nel file dei risultati."""
+    return (cell["experiment"], str(cell[cell["param_col"]]), cell["algorithm"])
+
+# -------------------------------
+# ESECUZIONE DI UNA CELLA
+# -------------------------------
+
+def run_cell(cell):
+    """
+    Worker: misura una cella e restituisce la riga da scrivere nei risultati.
+    Con timing = "adaptive" usa measure_sorting_time_adaptive e riempie anche
+    median_time, ci_low, ci_high e samples; altrimenti la misura a T_min fisso.
+    Con instrument = true aggiunge i contatori di instrumentation.instrument.
+    """
+    from measure_sorting_time import measure_sorting_time, measure_sorting_time_adaptive
+    func = algorithm_function(cell["algorithm"], cell["m"])
+    input_options = {"distribution": cell.get("distribution", "random"),
+                     "typed": cell.get("typed", False),
+                     "dtype": cell.get("dtype", "int64"),
+                     "disable_gc": cell.get("disable_gc", False)}
+    row = {"experiment": cell["experiment"],
+           cell["param_col"]: cell[cell["param_col"]],
+           "algorithm": cell["algorithm"]}
+
+    if cell.get("timing", "fixed") == "adaptive":
+        options = {key: cell[key] for key in ADAPTIVE_OPTIONS if key in cell}
+        stats = measure_sorting_time_adaptive(func, cell["n"], cell["m"], **input_options, **options)
+        mean_time, std_time = stats["mean"], stats["std"]
+        row.update({"median_time": stats["median"], "ci_low": stats["ci_low"],
+                    "ci_high": stats["ci_high"], "samples": stats["samples"]})
+    else:
+        mean_time, std_time = measure_sorting_time(func, cell["n"], cell["m"], cell["T_min"],
+                                                   num_trials=cell.get("num_trials", 10), **input_options)
+    row.update({"mean_time": mean_time,
+                "std_time": std_time,
+                "relative_error": std_time / mean_time if mean_time > 0 else 0.0})
+
+    if cell.get("instrument", False):
+        # esecuzione separata, dopo le misure di tempo, sullo stesso input del primo trial
+        from corpus import load_input
+        from instrumentation import NOT_COUNTABLE, instrument
+        data = load_input(input_options["distribution"], cell["n"], cell["m"], 0, input_options["dtype"]).tolist()
+        row.update(instrument(func, data, countable=cell["algorithm"] not in NOT_COUNTABLE))
+    return row
+
+def failed_row(cell, error):
+    """Riga di una cella fallita: tempi vuoti e l'errore nella colonna error."""
+    return {"experiment": cell["experiment"],
+            cell["param_col"]: cell[cell["param_col"]],
+            "algorithm": cell["algorithm"],
+            "error": error}
+
+def safe_run_cell(cell):
+    """
+    run_cell che non interrompe la griglia: un'eccezione (es. RecursionError di
+    quick_sort su un input avversario) diventa una riga con la colonna error.
+    """
+    try:
+        return run_cell(cell)
+    except Exception as e:
+        return failed_row(cell, f"{type(e).__name__}: {e}")
+
+def algorithm_function(name, m):
+    """Funzione dell'algoritmo name: ordinamenti di build_algorithms o operazioni di selection.py."""
+    algorithms = build_algorithms(m)
+    if name not in algorithms:
+        from selection import build_selection_algorithms
+        algorithms = build_selection_algorithms()
+    return algorithms[name]
+
+def _pin_worker(cpu_queue):
+    """Inizializzatore dei worker: fissa il processo su una delle CPU della coda."""
+    os.sched_setaffinity(0, {cpu_queue.get()})
+
+# -------------------------------
+# SCHEDULER CON CHECKPOINT
+# -------------------------------
+
+def completed_keys(results_path, fieldnames):
+    """
+    Chiavi delle celle già presenti nel file dei risultati (per riprendere un'esecuzione).
+    Il file vale come checkpoint solo se la sua intestazione è esattamente fieldnames:
+    un CSV scritto da una versione precedente (altre colonne) solleva ValueError
+    invece di far saltare le celle che contiene.
+    """
+    if not os.path.exists(results_path) or os.path.getsize(results_path) == 0:
+        return set()
+    with open(results_path, newline="") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != fieldnames:
+            raise ValueError(f"{results_path}: intestazione {reader.fieldnames} diversa da quella attesa "
+                             f"{fieldnames}; non si può riprendere, rieseguire con --fresh o rimuovere il file")
+        return {(row["experiment"], row[fieldnames[1]], row["algorithm"]) for row in reader}
+
+def run_grid(cells, results_path, jobs=None, cpus=None, isolate=False):
+    """
+    Esegue le celle su un pool di processi e accoda ogni risultato a results_path
+    (CSV) appena la cella termina, con flush e fsync: un'esecuzione interrotta
+    riprende saltando le celle già presenti nel file, se ha le colonne di RESULT_COLUMNS.
+    Una cella che solleva un'eccezione viene registrata con la colonna error (e
+    segnalata su stderr) senza fermare le altre; --fresh la riesegue.
+    jobs: numero di processi (default: len(cpus) oppure tutte le CPU);
+    cpus: insieme di CPU su cui fissare i worker, uno per CPU (es. core isolati).
+    isolate: ogni cella in un processo nuovo fissato su una CPU, con gc spento e
+    ordine casuale delle celle (vedi isolation.py); senza cpus usa una sola CPU.
+    Restituisce il numero di celle eseguite.
+    """
+    if not cells:
+        return 0
+    param_col = cells[0]["param_col"]
+    fieldnames = [c.format(param=param_col) for c in RESULT_COLUMNS]
+    done = completed_keys(results_path, fieldnames)
+    pending = [cell for cell in cells if cell_key(cell) not in done]
+    if not pending:
+        return 0
+
+    # un file esistente ha già l'intestazione fieldnames (verificata da completed_keys)
+    new_file = not os.path.exists(results_path) or os.path.getsize(results_path) == 0
+    jobs = jobs or (len(cpus) if cpus else os.cpu_count() or 1)
+    if cpus:
+        jobs = min(jobs, len(cpus))
+
+    with open(results_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        if new_file:
+            writer.writeheader()
+
+        if isolate:
+            from isolation import default_cpu, run_cells_isolated
+            _append_results(run_cells_isolated(pending, cpus or [default_cpu()]), writer, f)
+            return len(pending)
+
+        if jobs == 1 and not cpus:
+            results = map(safe_run_cell, pending)
+            _append_results(results, writer, f)
+            return len(pending)
+
+        with Manager() as manager:
+            cpu_queue = None
+            if cpus:
+                cpu_queue = manager.Queue()
+                for cpu in cpus:
+                    cpu_queue.put(cpu)
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     initializer=_pin_worker if cpus else None,
+                                     initargs=(cpu_queue,) if cpus else ()) as pool:
+                futures = [pool.submit(safe_run_cell, cell) for cell in pending]
+                _append_results((future.result() for future in as_completed(futures)), writer, f)
+    return len(pending)
+
+def _append_results(results, writer, f):
+    """Scrive i risultati uno alla volta, rendendoli persistenti subito."""
+    for row in results:
+        if row.get("error"):
+            print(f"{row['experiment']} {row['algorithm']}: cella fallita ({row['error']})", file=sys.stderr)
+        writer.writerow(row)
+        f.flush()
+        os.fsync(f.fileno())
@@ -0,0 +1,154 @@
+import os
+import sys
+import tracemalloc
+
+import Algorithms
+
+# Algoritmi che lavorano con NumPy o su file: per loro si misura solo la memoria di picco
+NOT_COUNTABLE = {"Counting Sort NumPy", "Radix Sort", "Radix Sort 11-bit", "Parallel Merge Sort",
+                 "Adaptive Sort", "External Merge Sort"}
+
+INSTRUMENT_COLUMNS = ["comparisons", "moves", "allocations", "max_depth", "peak_memory"]
+
+_comparisons = [0]
+_moves = [0]
+_ALGORITHMS_FILE = os.path.abspath(Algorithms.__file__)
+
+# -------------------------------
+# ELEMENTI E LISTE CHE CONTANO LE OPERAZIONI
+# -------------------------------
+
+class Counted:
+    """Intero che conta i confronti a cui partecipa (l'aritmetica restituisce int normali)."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        _comparisons[0] += 1
+        return self.value < _raw(other)
+
+    def __le__(self, other):
+        _comparisons[0] += 1
+        return self.value <= _raw(other)
+
+    def __gt__(self, other):
+        _comparisons[0] += 1
+        return self.value > _raw(other)
+
+    def __ge__(self, other):
+        _comparisons[0] += 1
+        return self.value >= _raw(other)
+
+    def __eq__(self, other):
+        _comparisons[0] += 1
+        return self.value == _raw(other)
+
+    def __ne__(self, other):
+        _comparisons[0] += 1
+        return self.value != _raw(other)
+
+    __hash__ = None
+
+    def __index__(self):
+        return self.value
+
+    def __add__(self, other):
+        return self.value + _raw(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.value - _raw(other)
+
+    def __rsub__(self, other):
+        return _raw(other) - self.value
+
+    def __neg__(self):
+        return -self.value
+
+    def __repr__(self):
+        return repr(self.value)
+
+def _raw(x):
+    return x.value if type(x) is Counted else x
+
+class TrackedList(list):
+    """Lista che conta le scritture di elementi (spostamenti) fatte tramite indice o slice."""
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            _moves[0] += len(value)
+        else:
+            _moves[0] += 1
+        super().__setitem__(index, value)
+
+# -------------------------------
+# MISURA DI UNA ESECUZIONE
+# -------------------------------
+
+def instrument(sort_func, data, countable=True):
+    """
+    Esegue sort_func su una copia di data (lista di interi) raccogliendo:
+    - comparisons: confronti tra elementi (elementi avvolti in Counted);
+    - moves: scritture di elementi nella lista di input e nel buffer ausiliario
+      (algoritmi in-place, lista TrackedList) più gli elementi delle nuove liste
+      restituite dalle funzioni di Algorithms.py (algoritmi che ricostruiscono liste);
+    - allocations: nuove liste restituite dalle funzioni di Algorithms.py;
+    - max_depth: massima profondità di chiamate annidate in Algorithms.py;
+    - peak_memory: picco di memoria allocata (tracemalloc) in un'esecuzione separata
+      senza strumentazione.
+    Con countable=False (algoritmi NumPy) si misura solo peak_memory.
+    Non ha alcun costo quando non viene usata: gli algoritmi non contengono contatori.
+    """
+    result = dict.fromkeys(INSTRUMENT_COLUMNS)
+    if countable:
+        result.update(_count_operations(sort_func, data))
+
+    arr = list(data)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    sort_func(arr)
+    result["peak_memory"] = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+    return result
+
+def _count_operations(sort_func, data):
+    """Conteggi di confronti, spostamenti, allocazioni e profondità (vedi instrument)."""
+    arr = TrackedList(Counted(x) for x in data)
+    state = {"depth": 0, "max_depth": 0, "allocations": 0, "moves": 0}
+
+    def profiler(frame, event, retval):
+        if frame.f_code.co_filename != _ALGORITHMS_FILE or frame.f_code.co_name.startswith("<"):
+            return
+        if event == "call":
+            state["depth"] += 1
+            state["max_depth"] = max(state["max_depth"], state["depth"])
+        elif event == "return":
+            state["depth"] -= 1
+            if isinstance(retval, list) and retval is not arr:
+                state["allocations"] += 1
+                if retval and type(retval[0]) is Counted:
+                    state["moves"] += len(retval)
+
+    _comparisons[0] = _moves[0] = 0
+    sys.setprofile(profiler)
+    try:
+        result = sort_func(arr)
+    finally:
+        sys.setprofile(None)
+    if isinstance(result, list) and result and type(result[0]) is not Counted:
+        # output ricostruito da valori interi (counting sort): ogni elemento è scritto una volta
+        state["moves"] += len(result)
+    return {
+        "comparisons": _comparisons[0],
+        "moves": _moves[0] + state["moves"],
+        "allocations": state["allocations"],
+        "max_depth": state["max_depth"]
+    }
@@ -0,0 +1,105 @@
+import os
+import sys
+import json
+import queue
+import random
+import platform
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Metadati dell'ambiente aggiunti a ogni riga misurata in isolamento
+ENVIRONMENT_COLUMNS = ["cpu", "cpu_model", "governor", "python_version"]
+
+# -------------------------------
+# METADATI DELL'AMBIENTE
+# -------------------------------
+
+def cpu_model():
+    """Nome del processore (da /proc/cpuinfo su Linux, altrimenti da platform)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+def frequency_governor(cpu):
+    """Governor della frequenza della CPU (es. performance, powersave) o "n/a" se non disponibile."""
+    try:
+        with open(f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_governor") as f:
+            return f.read().strip()
+    except OSError:
+        return "n/a"
+
+def environment_metadata(cpu):
+    """Metadati da registrare con ogni risultato misurato sulla CPU cpu."""
+    return {"cpu": cpu,
+            "cpu_model": cpu_model(),
+            "governor": frequency_governor(cpu),
+            "python_version": f"{platform.python_implementation()} {platform.python_version()}"}
+
+# -------------------------------
+# ESECUZIONE ISOLATA DI UNA CELLA
+# -------------------------------
+
+def run_isolated(cell, cpu):
+    """
+    Misura una cella in un processo Python nuovo fissato sulla CPU cpu, con il garbage
+    collector spento durante le misure: nessuno stato dell'heap o della cache di
+    import passa da una cella all'altra. Restituisce la riga dei risultati con i
+    metadati dell'ambiente.
+    """
+    child = subprocess.run([sys.executable, os.path.abspath(__file__), str(cpu)],
+                           input=json.dumps(cell), capture_output=True, text=True,
+                           cwd=os.path.dirname(os.path.abspath(__file__)))
+    if child.returncode != 0:
+        raise RuntimeError(f"cella {cell['experiment']} {cell['algorithm']} "
+                           f"{cell['param_col']}={cell[cell['param_col']]} fallita:\n{child.stderr}")
+    return json.loads(child.stdout.splitlines()[-1])
+
+def run_cells_isolated(cells, cpus, seed=None):
+    """
+    Esegue le celle in ordine casuale (così l'ordine degli algoritmi non introduce
+    effetti sistematici), un processo alla volta per ogni CPU di cpus. Una cella
+    il cui processo fallisce diventa una riga con la colonna error (grid.failed_row).
+    Restituisce un iteratore sulle righe, nell'ordine in cui le celle terminano.
+    """
+    cells = list(cells)
+    random.Random(seed).shuffle(cells)
+    free_cpus = queue.Queue()
+    for cpu in cpus:
+        free_cpus.put(cpu)
+
+    def worker(cell):
+        cpu = free_cpus.get()
+        try:
+            return run_isolated(cell, cpu)
+        except RuntimeError as e:
+            from grid import failed_row
+            return failed_row(cell, str(e).splitlines()[-1])
+        finally:
+            free_cpus.put(cpu)
+
+    with ThreadPoolExecutor(max_workers=len(cpus)) as pool:
+        futures = [pool.submit(worker, cell) for cell in cells]
+        for future in as_completed(futures):
+            yield future.result()
+
+def default_cpu():
+    """CPU usata di default: l'ultima tra quelle consentite (di solito la meno disturbata dal sistema)."""
+    return max(os.sched_getaffinity(0))
+
+def _child_main(cpu):
+    """Processo figlio: legge la cella (JSON) da stdin, la misura e scrive la riga (JSON) su stdout."""
+    os.sched_setaffinity(0, {cpu})
+    cell = json.loads(sys.stdin.read())
+    cell["disable_gc"] = True
+    from grid import run_cell
+    row = run_cell(cell)
+    row.update(environment_metadata(cpu))
+    print(json.dumps(row, default=float))
+
+if __name__ == "__main__":
+    _child_main(int(sys.argv[1]))
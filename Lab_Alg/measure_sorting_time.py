@@ -1,53 +1,175 @@
-from Algorithms import *
+import gc
+import time
+import numpy as np
+from contextlib import contextmanager
 
-def measure_init_time(n, m, T_min, num_trials=10):
-    """Misura il tempo medio di inizializzazione (generazione dell'array)."""
-    trial_init_times = []
-    for _ in range(num_trials):
-        count = 0
-        total_init_time = 0.0
-        trial_start = time.perf_counter()
-        t0 = time.perf_counter()
-        while True:
-            generate_array(n, m)
-            t1 = time.perf_counter()
-            total_init_time += (t1 - t0)
-            count += 1
-            if (time.perf_counter() - trial_start) >= T_min:
-                break
-        trial_init_times.append(total_init_time / count)
-    return np.mean(trial_init_times)
+from statistics import NormalDist
+
+from corpus import load_input
+
+# Ogni campione del motore adattivo deve durare almeno questo multiplo della risoluzione del clock
+SAMPLE_RESOLUTION_FACTOR = 1000
+# Campioni più lontani di OUTLIER_MADS deviazioni (stimate con la MAD) dalla mediana vengono scartati
+OUTLIER_MADS = 3.0
 
-def measure_sorting_time(sort_func, n, m, T_min, num_trials=10, subtract_init=False, init_time=0.0):
+def clock_resolution():
+    """Stima la risoluzione (in secondi) del clock usando time.perf_counter_ns()."""
+    start = time.perf_counter_ns()
+    while time.perf_counter_ns() == start:
+        pass
+    stop = time.perf_counter_ns()
+    return (stop - start) * 1e-9
+
+@contextmanager
+def gc_paused(disable_gc=True):
+    """Disattiva il garbage collector nel blocco (misure senza pause di raccolta) e poi raccoglie."""
+    if not disable_gc or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+        gc.collect()
+
+def prepare_input(distribution, n, m, seed=0, typed=False, dtype="int64"):
+    """
+    Carica l'input dal corpus e restituisce (work, restore): work è il buffer su cui
+    ordinare (lista o ndarray con typed=True), restore() lo riporta all'input originale
+    con una copia di buffer (copia in-place della lista o np.copyto).
+    """
+    src = load_input(distribution, n, m, seed, dtype)
+    if typed:
+        work = np.empty_like(src)
+        return work, lambda: np.copyto(work, src)
+    src = src.tolist()
+    work = src[:]
+
+    def restore():
+        work[:] = src
+
+    return work, restore
+
+def measure_sorting_time(sort_func, n, m, T_min, num_trials=10, distribution="random",
+                         typed=False, dtype="int64", seed=0, disable_gc=False, warmup=1):
     """
     Misura il tempo medio di esecuzione del sort_func su array di dimensione n e range m.
-    Esegue l'algoritmo ripetutamente fino a superare T_min e calcola il tempo medio per iterazione.
-    Se subtract_init=True, viene sottratto il tempo medio di inizializzazione.
+    Gli input vengono dal corpus (corpus.load_input), generati e salvati su disco fuori
+    dalla misura: la prova i usa l'input con seed seed + i della distribuzione richiesta
+    ("random" o "sorted" per il caso pessimo). Esegue l'algoritmo ripetutamente fino a
+    superare T_min cronometrando solo l'ordinamento; prima di ogni esecuzione l'input
+    viene ripristinato con una copia di buffer (np.copyto con typed=True, altrimenti
+    una copia in-place della lista). Con disable_gc=True il garbage collector è
+    spento durante ogni prova e la memoria viene raccolta tra una prova e l'altra.
+    Prima della prima prova sort_func viene eseguito warmup volte senza misurarlo:
+    i costi della prima chiamata (import pigri, pool di processi, cache) restano
+    fuori dai tempi, anche quando ogni cella gira in un processo nuovo.
     """
+    T_min_ns = T_min * 1e9
     trial_times = []
-    for _ in range(num_trials):
+    for trial in range(num_trials):
+        work, restore = prepare_input(distribution, n, m, seed + trial, typed, dtype)
+        if trial == 0:
+            for _ in range(warmup):
+                restore()
+                sort_func(work)
         count = 0
-        total_sort_time = 0.0
-        trial_start = time.perf_counter()
-        t0 = time.perf_counter()
-        while True:
-            arr = generate_array(n, m)
-            sort_func(arr[:])
-            t1 = time.perf_counter()
-            total_sort_time += (t1 - t0)
-            count += 1
-            if (time.perf_counter() - trial_start) >= T_min:
-                break
-        avg_time = total_sort_time / count
-        if subtract_init:
-            avg_time -= init_time
-        trial_times.append(avg_time)
+        total_sort_time = 0
+        with gc_paused(disable_gc):
+            trial_start = time.perf_counter_ns()
+            while True:
+                restore()
+                t0 = time.perf_counter_ns()
+                sort_func(work)
+                total_sort_time += time.perf_counter_ns() - t0
+                count += 1
+                if (time.perf_counter_ns() - trial_start) >= T_min_ns:
+                    break
+        trial_times.append(total_sort_time * 1e-9 / count)
     mean_time = np.mean(trial_times)
     std_time = np.std(trial_times)
     return mean_time, std_time
 
-for n in n_values:
-    init_avg = measure_init_time(n, m_fixed, T_min) if subtract_init else 0.0
-    for name, func in algoritmi.items():
-        mean_time, std_time = measure_sorting_time(func, n, m_fixed, T_min, subtract_init=subtract_init, init_time=init_avg)
-        rel_error = std_time / mean_time if mean_time > 0 else 0.0
\ No newline at end of file
+def measure_sorting_time_adaptive(sort_func, n, m, distribution="random", typed=False, dtype="int64", seed=0,
+                                  warmup=2, rel_ci_width=0.05, confidence=0.95, min_samples=5,
+                                  max_samples=200, time_budget=2.0, disable_gc=False):
+    """
+    Motore di misura statistico:
+    1. warmup esecuzioni non misurate;
+    2. calibra il numero di ripetizioni per campione (raddoppiandolo) finché un
+       campione dura almeno SAMPLE_RESOLUTION_FACTOR volte la risoluzione del clock;
+    3. raccoglie campioni (tempo per ripetizione, ripristino dell'input escluso) finché
+       l'intervallo di confidenza della mediana, relativo alla mediana, è più stretto
+       di rel_ci_width, oppure si esauriscono time_budget secondi o max_samples campioni;
+    4. scarta gli outlier con la MAD.
+    Con disable_gc=True il garbage collector è spento durante i campioni misurati.
+    Restituisce un dizionario con median, ci_low, ci_high, samples, reps, mean, std.
+    """
+    work, restore = prepare_input(distribution, n, m, seed, typed, dtype)
+    for _ in range(warmup):
+        restore()
+        sort_func(work)
+
+    min_sample_time = clock_resolution() * SAMPLE_RESOLUTION_FACTOR
+    reps = 1
+    while _timed_sample(sort_func, work, restore, reps) < min_sample_time:
+        reps *= 2
+
+    samples = []
+    start = time.perf_counter_ns()
+    while len(samples) < max_samples:
+        with gc_paused(disable_gc):
+            samples.append(_timed_sample(sort_func, work, restore, reps) / reps)
+        if len(samples) >= min_samples:
+            stats = robust_summary(samples, confidence)
+            if (stats["samples"] >= min_samples
+                    and stats["ci_high"] - stats["ci_low"] <= rel_ci_width * stats["median"]):
+                break
+        if (time.perf_counter_ns() - start) * 1e-9 >= time_budget:
+            break
+
+    stats = robust_summary(samples, confidence)
+    stats["reps"] = reps
+    return stats
+
+def _timed_sample(sort_func, work, restore, reps):
+    """
+    Durata in secondi di reps ordinamenti: come in measure_sorting_time si cronometra
+    solo sort_func, il ripristino dell'input (O(n) per le liste) resta fuori, così
+    misura fissa e adattiva misurano la stessa cosa.
+    """
+    total = 0
+    for _ in range(reps):
+        restore()
+        t0 = time.perf_counter_ns()
+        sort_func(work)
+        total += time.perf_counter_ns() - t0
+    return total * 1e-9
+
+def robust_summary(samples, confidence=0.95):
+    """
+    Scarta gli outlier (oltre OUTLIER_MADS deviazioni stimate con la MAD) e calcola
+    mediana, intervallo di confidenza della mediana (statistiche d'ordine, senza
+    ipotesi sulla distribuzione), media e deviazione standard dei campioni rimasti.
+    """
+    data = np.sort(np.asarray(samples, dtype=float))
+    median = np.median(data)
+    mad = np.median(np.abs(data - median)) * 1.4826
+    if mad > 0:
+        data = data[np.abs(data - median) <= OUTLIER_MADS * mad]
+        median = np.median(data)
+
+    k = len(data)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    half = z * np.sqrt(k) / 2
+    low = max(int(np.floor(k / 2 - half)), 0)
+    high = min(int(np.ceil(k / 2 + half)), k - 1)
+    return {
+        "median": float(median),
+        "ci_low": float(data[low]),
+        "ci_high": float(data[high]),
+        "samples": k,
+        "mean": float(np.mean(data)),
+        "std": float(np.std(data))
+    }
@@ -0,0 +1,168 @@
+import os
+import atexit
+from array import array
+from multiprocessing import Pool, shared_memory
+import numpy as np
+
+# Sotto questa dimensione non conviene distribuire il lavoro tra processi
+PARALLEL_THRESHOLD = 100000
+# Campioni prelevati da ogni chunk ordinato per scegliere gli splitter
+SAMPLES_PER_CHUNK = 64
+
+_pools = {}
+
+# -------------------------------
+# ORDINAMENTO PARALLELO
+# -------------------------------
+
+def parallel_merge_sort(arr, workers=None, force=False):
+    """
+    Merge sort parallelo su più processi.
+    L'input viene copiato una sola volta in un blocco di shared memory: ogni
+    worker ordina il proprio chunk direttamente nel blocco, poi gli splitter
+    (scelti per campionamento) dividono l'output in partizioni indipendenti
+    e ogni worker esegue la fusione k-way della propria partizione in un
+    secondo blocco condiviso. Nessuna lista viene serializzata con pickle.
+    Con un solo worker o meno di PARALLEL_THRESHOLD elementi si usa np.sort, a meno
+    di force=True: i benchmark lo usano per misurare sempre il percorso parallelo.
+    Restituisce un ndarray se l'input è un buffer tipizzato, altrimenti una lista.
+    """
+    a = np.asarray(arr)
+    workers = workers or os.cpu_count() or 1
+    if a.size < 2 or (not force and (workers == 1 or a.size < PARALLEL_THRESHOLD)):
+        sorted_arr = np.sort(a, kind="mergesort")
+        return sorted_arr if isinstance(arr, (np.ndarray, memoryview, array)) else sorted_arr.tolist()
+
+    n, dtype = a.size, a.dtype
+    src_shm = shared_memory.SharedMemory(create=True, size=a.nbytes)
+    dst_shm = shared_memory.SharedMemory(create=True, size=a.nbytes)
+    try:
+        src = np.ndarray((n,), dtype=dtype, buffer=src_shm.buf)
+        src[:] = a
+
+        # Fase 1: ogni worker ordina un chunk contiguo
+        edges = [n * c // workers for c in range(workers + 1)]
+        pool = _get_pool(workers)
+        pool.map(_sort_chunk, [(src_shm.name, dtype.str, n, edges[c], edges[c + 1])
+                               for c in range(workers)])
+
+        # Fase 2: splitter comuni e tagli di ogni chunk
+        chunks = [src[edges[c]:edges[c + 1]] for c in range(workers)]
+        splitters = _choose_splitters(chunks, workers)
+        cuts = [[0] + np.searchsorted(chunk, splitters, side="left").tolist() + [chunk.size]
+                for chunk in chunks]
+
+        # Fase 3: fusione k-way parallela, una partizione dell'output per worker
+        tasks = []
+        offset = 0
+        for q in range(workers):
+            pieces = [(edges[c] + cuts[c][q], edges[c] + cuts[c][q + 1]) for c in range(workers)]
+            size = sum(hi - lo for lo, hi in pieces)
+            tasks.append((src_shm.name, dst_shm.name, dtype.str, n, pieces, offset))
+            offset += size
+        pool.map(_merge_partition, tasks)
+
+        dst = np.ndarray((n,), dtype=dtype, buffer=dst_shm.buf)
+        sorted_arr = dst.copy() if isinstance(arr, (np.ndarray, memoryview, array)) else dst.tolist()
+        del src, chunks, dst
+    finally:
+        for shm in (src_shm, dst_shm):
+            shm.close()
+            shm.unlink()
+    return sorted_arr
+
+def _choose_splitters(chunks, parts):
+    """Sceglie parts-1 splitter da campioni regolari dei chunk già ordinati."""
+    samples = np.concatenate([chunk[np.linspace(0, chunk.size - 1, SAMPLES_PER_CHUNK, dtype=np.intp)]
+                              for chunk in chunks if chunk.size])
+    samples.sort()
+    picks = [samples.size * q // parts for q in range(1, parts)]
+    return samples[picks]
+
+def _sort_chunk(args):
+    """Worker: ordina in-place src[lo:hi] nel blocco condiviso."""
+    name, dtype, n, lo, hi = args
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        src = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+        src[lo:hi].sort(kind="mergesort")
+        del src
+    finally:
+        shm.close()
+
+def _merge_partition(args):
+    """Worker: fonde i tratti ordinati pieces di src in dst[offset:...]."""
+    src_name, dst_name, dtype, n, pieces, offset = args
+    src_shm = shared_memory.SharedMemory(name=src_name)
+    dst_shm = shared_memory.SharedMemory(name=dst_name)
+    try:
+        src = np.ndarray((n,), dtype=dtype, buffer=src_shm.buf)
+        dst = np.ndarray((n,), dtype=dtype, buffer=dst_shm.buf)
+        k = offset
+        for lo, hi in pieces:
+            dst[k:k + hi - lo] = src[lo:hi]
+            k += hi - lo
+        # I tratti sono run già ordinati: il timsort di NumPy li fonde in O(m log k)
+        dst[offset:k].sort(kind="stable")
+        del src, dst
+    finally:
+        src_shm.close()
+        dst_shm.close()
+
+def _get_pool(workers):
+    """Restituisce (creandolo una sola volta) il pool con il numero di worker richiesto."""
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = Pool(workers)
+        _pools[workers] = pool
+    return pool
+
+@atexit.register
+def _close_pools():
+    for pool in _pools.values():
+        pool.terminate()
+    _pools.clear()
+
+# -------------------------------
+# BENCHMARK DELLO SPEEDUP
+# -------------------------------
+
+def benchmark_speedup(n, m, max_workers=None, num_trials=3):
+    """
+    Confronta parallel_merge_sort (percorso parallelo forzato, anche con 1 worker)
+    con merge_sort per 1..max_workers processi. Entrambi sono misurati con lo stesso
+    ciclo di measure_sorting_time: stesso input dal corpus, prova non misurata
+    iniziale (avvio del pool compreso) e num_trials prove.
+    Restituisce una lista di dizionari (workers, mean_time, speedup_vs_merge_sort,
+    speedup_vs_1_worker) e la stampa come tabella.
+    """
+    from Algorithms import build_algorithms
+    from measure_sorting_time import clock_resolution, measure_sorting_time
+
+    max_workers = max_workers or os.cpu_count() or 1
+    T_min = clock_resolution() * 10
+
+    def measure(sort_func):
+        mean_time, _ = measure_sorting_time(sort_func, n, m, T_min, num_trials=num_trials, typed=True)
+        return float(mean_time)
+
+    base_time = measure(build_algorithms(m)["Merge Sort"])
+
+    results = []
+    for w in range(1, max_workers + 1):
+        mean_time = measure(lambda arr, w=w: parallel_merge_sort(arr, workers=w, force=True))
+        results.append({
+            "workers": w,
+            "mean_time": mean_time,
+            "speedup_vs_merge_sort": base_time / mean_time,
+            "speedup_vs_1_worker": results[0]["mean_time"] / mean_time if results else 1.0
+        })
+
+    print(f"n = {n}, m = {m}, Merge Sort: {base_time:.3f} s")
+    print("workers  tempo (s)  speedup vs Merge Sort  speedup vs 1 worker")
+    for r in results:
+        print(f"{r['workers']:>7}  {r['mean_time']:>9.4f}  {r['speedup_vs_merge_sort']:>21.1f}  {r['speedup_vs_1_worker']:>19.2f}")
+    return results
+
+if __name__ == "__main__":
+    benchmark_speedup(n=10**7, m=10**9)
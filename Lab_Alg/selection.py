@@ -0,0 +1,135 @@
+import heapq
+
+from Algorithms import _insertion_sort_range, _median_of_three, _partition3, as_sequence, intro_sort
+
+# Sotto questa dimensione la selezione ordina direttamente l'intervallo
+SELECT_THRESHOLD = 16
+# Gruppi della mediana delle mediane
+GROUP_SIZE = 5
+# Partizioni con pivot casuale che possono non dimezzare l'intervallo prima di passare
+# alla mediana delle mediane (costante: il caso pessimo resta O(n))
+MAX_BAD_PARTITIONS = 3
+
+# -------------------------------
+# SELEZIONE (INTROSELECT)
+# -------------------------------
+
+def select(arr, k):
+    """
+    nth_element: riordina arr in-place in modo che arr[k] sia il k-esimo elemento
+    (da 0) dell'ordinamento, con arr[:k] <= arr[k] <= arr[k+1:], e lo restituisce.
+    Introselect: partizione a tre vie di intro_sort con pivot mediana di tre casuali,
+    proseguendo solo nel lato che contiene k (O(n) atteso). Si controlla quanto si
+    restringe l'intervallo: dopo MAX_BAD_PARTITIONS partizioni che non lo dimezzano il
+    pivot diventa la mediana delle mediane, che garantisce O(n) nel caso pessimo
+    (le partizioni buone costano una serie geometrica, quelle cattive al più una
+    costante per n).
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError(f"k = {k} fuori dall'intervallo [0, {n})")
+    _select_range(arr, 0, n - 1, k, MAX_BAD_PARTITIONS)
+    return arr[k]
+
+def _select_range(arr, lo, hi, k, bad_left):
+    """
+    Introselect su arr[lo..hi] (lo <= k <= hi); bad_left = partizioni casuali che possono
+    ancora non dimezzare l'intervallo (a 0 si usa solo la mediana delle mediane).
+    """
+    while hi - lo + 1 > SELECT_THRESHOLD:
+        size = hi - lo + 1
+        if bad_left > 0:
+            pivot = _median_of_three(arr, lo, hi)
+        else:
+            pivot = _median_of_medians(arr, lo, hi)
+        lt, gt = _partition3(arr, lo, hi, pivot)
+        if k < lt:
+            hi = lt - 1
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return
+        if bad_left > 0 and 2 * (hi - lo + 1) > size:
+            bad_left -= 1
+    _insertion_sort_range(arr, lo, hi)
+
+def _median_of_medians(arr, lo, hi):
+    """
+    Pivot della mediana delle mediane: ordina ogni gruppo di GROUP_SIZE elementi,
+    ne porta la mediana in testa all'intervallo e seleziona la mediana di queste
+    (almeno 3/10 degli elementi stanno da ciascun lato del pivot).
+    """
+    medians = lo
+    for start in range(lo, hi + 1, GROUP_SIZE):
+        end = min(start + GROUP_SIZE - 1, hi)
+        _insertion_sort_range(arr, start, end)
+        mid = (start + end) // 2
+        arr[medians], arr[mid] = arr[mid], arr[medians]
+        medians += 1
+    middle = (lo + medians - 1) // 2
+    # la selezione delle mediane parte con depth 0: resta lineare nel caso pessimo
+    _select_range(arr, lo, medians - 1, middle, 0)
+    return arr[middle]
+
+# -------------------------------
+# ORDINAMENTO PARZIALE E TOP-K
+# -------------------------------
+
+def partial_sort(arr, k):
+    """
+    Porta in arr[:k], ordinati, i k elementi più piccoli (il resto in ordine qualsiasi):
+    select in O(n) e intro_sort dei soli primi k, O(n + k log k). Restituisce arr.
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return arr
+    select(arr, k - 1)
+    arr[:k] = intro_sort(arr[:k])
+    return arr
+
+def top_k(arr, k, largest=False):
+    """
+    I k elementi più piccoli di arr (i più grandi con largest=True), ordinati
+    (decrescenti con largest=True). arr non viene modificato.
+    """
+    work = list(arr)
+    k = min(k, len(work))
+    if k <= 0:
+        return []
+    if not largest:
+        return partial_sort(work, k)[:k]
+    select(work, len(work) - k)
+    result = intro_sort(work[len(work) - k:])
+    result.reverse()
+    return result
+
+def top_k_stream(iterable, k, largest=False):
+    """
+    Top-k in streaming su un iterabile qualsiasi (anche più grande della memoria,
+    es. external_sort.read_chunks o un generatore): uno heap di k elementi,
+    O(n log k) tempo e O(k) memoria. Stesso risultato di top_k.
+    """
+    if largest:
+        return heapq.nlargest(k, iterable)
+    return heapq.nsmallest(k, iterable)
+
+# -------------------------------
+# REGISTRO PER L'HARNESS
+# -------------------------------
+
+# Rapporti k/n confrontati con l'ordinamento completo
+K_RATIOS = (0.001, 0.01, 0.1, 0.5)
+
+def build_selection_algorithms():
+    """
+    Registro nome -> funzione delle operazioni di selezione, da confrontare negli
+    esperimenti con gli ordinamenti completi (vedi specs/selection.toml).
+    """
+    algorithms = {"Select (mediana)": lambda arr: select(as_sequence(arr), len(arr) // 2)}
+    for ratio in K_RATIOS:
+        label = f"k = {ratio:.1%} n"
+        algorithms[f"Partial Sort ({label})"] = \
+            lambda arr, r=ratio: partial_sort(as_sequence(arr), max(1, int(len(arr) * r)))
+        algorithms[f"Top-k Heap ({label})"] = \
+            lambda arr, r=ratio: top_k_stream(iter(as_sequence(arr)), max(1, int(len(arr) * r)))
+    return algorithms
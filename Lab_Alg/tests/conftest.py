@@ -0,0 +1,7 @@
+import os
+import sys
+
+# i moduli di Lab_Alg e di Esercizi si importano per nome (from Algorithms import ...), come negli script
+LAB_ALG = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(LAB_ALG, "Esercizi"))
+sys.path.insert(0, LAB_ALG)
@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+
+import io
+import os
+import random
+from array import array
+
+from Algorithms import (adaptive_sort, counting_sort, counting_sort_np, intro_sort, merge_sort,
+                        natural_merge_sort, quick_sort_3way, radix_sort, sort_by_key)
+from external_sort import external_sort, token_blocks
+from instrumentation import TrackedList
+from Es22 import AVLTree, CompactAVLTree
+
+def random_inputs(rng, count=50, max_n=500):
+    """Input casuali dei tipi che mettono alla prova run, galloping e partizioni."""
+    for _ in range(count):
+        n = rng.randint(0, max_n)
+        kind = rng.choice(["random", "few_unique", "sorted", "reversed", "runs"])
+        if kind == "random":
+            yield [rng.randint(-10**6, 10**6) for _ in range(n)]
+        elif kind == "few_unique":
+            yield [rng.randint(0, 3) for _ in range(n)]
+        elif kind == "sorted":
+            yield sorted(rng.randint(0, 1000) for _ in range(n))
+        elif kind == "reversed":
+            yield sorted((rng.randint(0, 1000) for _ in range(n)), reverse=True)
+        else:
+            # run lunghi ascendenti e discendenti alternati: galloping e run invertiti
+            data = []
+            while len(data) < n:
+                run = sorted(rng.randint(0, 10**4) for _ in range(rng.randint(1, 100)))
+                data.extend(run if rng.random() < 0.5 else run[::-1])
+            yield data[:n]
+
+# -------------------------------
+# ORDINAMENTI PER CONFRONTI
+# -------------------------------
+
+@pytest.mark.parametrize("container", ["list", "memoryview", "array", "TrackedList"])
+def test_natural_merge_sort_containers(container):
+    rng = random.Random(0)
+    for data in random_inputs(rng):
+        if container == "list":
+            work = data[:]
+        elif container == "memoryview":
+            work = memoryview(np.array(data, dtype=np.int64))
+        elif container == "array":
+            work = array("q", data)
+        else:
+            work = TrackedList(data)
+        assert natural_merge_sort(work) is work
+        assert list(work) == sorted(data)
+
+def test_intro_sort():
+    rng = random.Random(1)
+    for data in random_inputs(rng):
+        work = data[:]
+        assert intro_sort(work) is work
+        assert work == sorted(data)
+    work = memoryview(np.array(data, dtype=np.int64))
+    intro_sort(work)
+    assert work.tolist() == sorted(data)
+
+@pytest.mark.parametrize("sort_func", [quick_sort_3way, intro_sort, merge_sort, natural_merge_sort])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_by_key_stable(sort_func, reverse):
+    rng = random.Random(2)
+    records = [(rng.randint(0, 9), i) for i in range(300)]
+    result = sort_by_key(sort_func, records, key=lambda r: r[0], reverse=reverse)
+    # sorted() è stabile anche con reverse=True
+    assert result == sorted(records, key=lambda r: r[0], reverse=reverse)
+
+# -------------------------------
+# ORDINAMENTO ESTERNO
+# -------------------------------
+
+@pytest.mark.parametrize("fmt", ["binary", "text"])
+def test_external_sort(tmp_path, fmt):
+    rng = random.Random(3)
+    data = [rng.randint(-2**40, 2**40) for _ in range(5000)]
+    input_path, output_path = tmp_path / "input", tmp_path / "output"
+    if fmt == "binary":
+        input_path.write_bytes(array("q", data).tobytes())
+    else:
+        input_path.write_text(" ".join(map(str, data)))
+    # memoria piccola e fan-in 2: molti run e più passate di fusione
+    count = external_sort(str(input_path), str(output_path), memory_budget=4096, fmt=fmt,
+                          tmp_dir=str(tmp_path), max_fan_in=2)
+    assert count == len(data)
+    if fmt == "binary":
+        result = array("q")
+        result.frombytes(output_path.read_bytes())
+        result = result.tolist()
+    else:
+        result = [int(token) for token in output_path.read_text().split()]
+    assert result == sorted(data)
+
+def test_token_blocks_boundaries():
+    data = b"10 -5 NULL  123456\n7"
+    # blocchi piccoli: i token vengono spezzati a cavallo dei blocchi
+    for block_size in range(1, len(data) + 2):
+        tokens = [t for block in token_blocks(io.BytesIO(data), block_size) for t in block]
+        assert tokens == data.split()
+
+def test_external_sort_truncated_input(tmp_path):
+    input_path = tmp_path / "input"
+    input_path.write_bytes(array("q", [3, 1, 2]).tobytes() + b"\x01\x02")
+    with pytest.raises(ValueError):
+        external_sort(str(input_path), str(tmp_path / "output"))
+
+# -------------------------------
+# AVL COMPATTO
+# -------------------------------
+
+def test_compact_avl_matches_avl():
+    rng = random.Random(4)
+    for _ in range(50):
+        tree, compact = AVLTree(), CompactAVLTree()
+        for step in range(rng.randint(0, 300)):
+            key = rng.randint(0, 60)
+            if rng.random() < 0.6:
+                tree.insert(key, f"v{step}")
+                compact.insert(key, f"v{step}")
+            else:
+                tree.remove(key)
+                compact.remove(key)
+            assert compact._preorder() == tree._preorder(tree.root)
+        for key in range(61):
+            assert compact._find(key) == tree._find(tree.root, key)
+
+# -------------------------------
+# COUNTING SORT
+# -------------------------------
+
+def test_counting_sort_np_rejects_floats():
+    with pytest.raises(TypeError):
+        counting_sort_np([1.5, 0.2])
+    with pytest.raises(TypeError):
+        counting_sort_np(np.array([1.5, 0.2]))
+    # stesso contratto della versione in Python puro
+    with pytest.raises(TypeError):
+        counting_sort([1.5, 0.2], 2)
+
+def test_counting_sort_np_integers():
+    data = [5, -3, 0, 5, 2, -3, 1000]
+    assert counting_sort_np(data) == sorted(data)
+    a = np.array(data, dtype=np.int32)
+    np.testing.assert_array_equal(counting_sort_np(a), np.sort(a))
+
+# -------------------------------
+# RADIX SORT
+# -------------------------------
+
+def test_radix_sort_rejects_floats():
+    with pytest.raises(TypeError):
+        radix_sort([1.5, 0.2])
+    with pytest.raises(TypeError):
+        radix_sort(np.array([1.5, 0.2]))
+
+def test_radix_sort_negative_values():
+    data = [3, -5, 2, -2**63, 2**63 - 1, 0, -1]
+    assert radix_sort(data) == sorted(data)
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.int32, np.int64])
+def test_radix_sort_signed_dtypes(dtype):
+    info = np.iinfo(dtype)
+    a = np.random.default_rng(0).integers(info.min, info.max, 1000, dtype=dtype, endpoint=True)
+    result = radix_sort(a)
+    assert result.dtype == dtype
+    np.testing.assert_array_equal(result, np.sort(a))
+
+def test_radix_sort_large_uint64():
+    a = np.array([2**64 - 1, 2**63, 5, 2**63 - 1, 0, 2**63 + 1], dtype=np.uint64)
+    result = radix_sort(a)
+    assert result.dtype == np.uint64
+    np.testing.assert_array_equal(result, np.sort(a))
+
+# -------------------------------
+# ADAPTIVE SORT
+# -------------------------------
+
+@pytest.mark.parametrize("max_value", [10, 10**9])
+def test_adaptive_sort_float_outside_sample(max_value):
+    # il campione di sample_profile non contiene mai l'ultimo elemento: sembra un input di interi
+    rng = random.Random(0)
+    data = [rng.randint(0, max_value) for _ in range(5000)]
+    data[-1] = 0.5
+    work = data[:]
+    assert adaptive_sort(work) is work
+    assert work == sorted(data)
+
+def test_adaptive_sort_integers_beyond_64_bits():
+    rng = random.Random(0)
+    data = [rng.randint(-2**70, 2**70) for _ in range(5000)]
+    work = data[:]
+    assert adaptive_sort(work) is work
+    assert work == sorted(data)
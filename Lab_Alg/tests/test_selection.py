@@ -0,0 +1,33 @@
+import random
+
+import selection
+from selection import select
+
+def test_select_matches_sorted():
+    rng = random.Random(0)
+    for _ in range(200):
+        data = [rng.randint(0, 50) for _ in range(rng.randint(1, 300))]
+        k = rng.randrange(len(data))
+        work = data[:]
+        value = select(work, k)
+        assert value == sorted(data)[k]
+        assert all(x <= value for x in work[:k]) and all(x >= value for x in work[k + 1:])
+
+def test_select_linear_with_adversarial_pivots(monkeypatch):
+    # pivot avversario: il minimo dell'intervallo, ogni partizione casuale toglie un solo elemento
+    monkeypatch.setattr(selection, "_median_of_three", lambda arr, lo, hi: min(arr[lo:hi + 1]))
+    partition3 = selection._partition3
+    work = [0]
+
+    def counting_partition3(arr, lo, hi, pivot):
+        work[0] += hi - lo + 1
+        return partition3(arr, lo, hi, pivot)
+
+    monkeypatch.setattr(selection, "_partition3", counting_partition3)
+    for n in (2**12, 2**16):
+        work[0] = 0
+        data = list(range(n))
+        random.Random(n).shuffle(data)
+        assert select(data, n - 1) == n - 1
+        # elementi partizionati: lineare in n (con il vecchio limite di 2*log2(n) partizioni erano ~30 n)
+        assert work[0] < 10 * n